@@ -0,0 +1,126 @@
+import math
+import os
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import FileResponse
+from sqlalchemy.orm import Session
+from app.core.audit import audit_log
+from app.core.change_feed import change_feed
+from app.core.concurrency import route_limiters
+from app.core.invalidation import invalidation_bus
+from app.config import settings
+from app.core.jobs import job_queue
+from app.core.profiling import PROFILE_HEADER, create_profile_token
+from app.core.security import get_current_superuser
+from app.core.slow_query import slow_query_log
+from app.dependencies import get_db
+from app.schemas.audit import AuditLogResponse
+from app.schemas.pagination import PageParams, PaginatedResponse
+from app.services.audit_service import AuditService
+
+router = APIRouter(
+    prefix="/admin",
+    tags=["Admin"],
+    dependencies=[Depends(get_current_superuser)]
+)
+
+@router.get("/jobs")
+def job_queue_stats():
+    """Background job queue depth, latency and dead letters"""
+    return {
+        "stats": job_queue.stats(),
+        "dead_letters": [
+            {
+                "job": job.name,
+                "attempts": job.attempts,
+                "error": job.last_error
+            }
+            for job in job_queue.dead_letters
+        ]
+    }
+
+@router.post("/profile-token")
+def issue_profile_token():
+    """Token that enables profiling for any request sending it as a header"""
+    if not settings.PROFILING_ENABLED:
+        raise HTTPException(status_code=409, detail="Profiling is disabled (PROFILING_ENABLED)")
+    return {
+        "header": PROFILE_HEADER,
+        "token": create_profile_token(settings.PROFILING_TOKEN_TTL_SECONDS),
+        "expires_in": settings.PROFILING_TOKEN_TTL_SECONDS
+    }
+
+@router.get("/profiles")
+def list_profiles():
+    """Recorded profiles, newest first"""
+    directory = settings.PROFILING_OUTPUT_DIR
+    if not os.path.isdir(directory):
+        return []
+    names = [name for name in os.listdir(directory) if name.endswith(".speedscope.json")]
+    return sorted((name[:-len(".speedscope.json")] for name in names), reverse=True)
+
+@router.get("/profiles/{profile_id}")
+def download_profile(profile_id: str):
+    """Download a profile; open it at https://www.speedscope.app"""
+    name = os.path.basename(profile_id) + ".speedscope.json"
+    path = os.path.join(settings.PROFILING_OUTPUT_DIR, name)
+    if not os.path.isfile(path):
+        raise HTTPException(status_code=404, detail="Profile not found")
+    return FileResponse(path, media_type="application/json", filename=name)
+
+@router.get("/slow-queries")
+def list_slow_queries(limit: int = Query(100, ge=1, le=1000)):
+    """Recent statements over SLOW_QUERY_THRESHOLD_MS with their EXPLAIN plans"""
+    return {
+        "threshold_ms": settings.SLOW_QUERY_THRESHOLD_MS,
+        "entries": slow_query_log.entries(limit)
+    }
+
+@router.delete("/slow-queries", status_code=204)
+def clear_slow_queries():
+    slow_query_log.clear()
+
+@router.get("/concurrency")
+def concurrency_stats():
+    """Current adaptive limits, in-flight and queued requests per route class"""
+    return {name: limiter.stats() for name, limiter in route_limiters.items()}
+
+@router.get("/change-feed")
+def change_feed_stats():
+    """Open membership streams and fan-out counters"""
+    return change_feed.stats()
+
+@router.get("/invalidation")
+def invalidation_bus_stats():
+    """Cross-worker invalidation traffic and propagation lag"""
+    return invalidation_bus.stats()
+
+@router.get("/audit", response_model=PaginatedResponse[AuditLogResponse])
+def list_audit_events(
+    organization_id: Optional[int] = None,
+    actor_id: Optional[int] = None,
+    action: Optional[str] = None,
+    params: PageParams = Depends(),
+    db: Session = Depends(get_db)
+):
+    """Audit trail of organization and membership changes, newest first"""
+    events, total = AuditService.list_events(
+        db,
+        params.page,
+        params.size,
+        organization_id=organization_id,
+        actor_id=actor_id,
+        action=action
+    )
+    return {
+        "items": events,
+        "total": total,
+        "page": params.page,
+        "size": params.size,
+        "pages": math.ceil(total / params.size) if total else 0
+    }
+
+@router.get("/audit/stats")
+def audit_buffer_stats():
+    """Audit buffer fill level and flush counters"""
+    return audit_log.stats()
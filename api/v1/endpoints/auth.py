@@ -1,9 +1,11 @@
+from typing import Optional
 from fastapi import APIRouter,Depends,HTTPException
 from app.dependencies import get_db
 from sqlalchemy.orm import Session
-from app.schemas.user import UserCreate,UserResponse,UserLogin,LoginResponse
+from app.schemas.user import UserCreate,UserResponse,UserLogin,LoginResponse,RefreshRequest,TokenResponse
 from app.services.user_service import UserService
-from app.core.security import create_access_token
+from app.services.token_service import TokenService
+from app.core.security import decode_access_token, oauth2_scheme
 from fastapi.security import OAuth2PasswordRequestForm
 
 router = APIRouter(
@@ -23,10 +25,9 @@ def register(user_data: UserCreate,db : Session = Depends(get_db)):
 def login(user_data: UserLogin ,db : Session = Depends(get_db)):
     try:
         user=UserService.authenticate_user(db=db,userdata=user_data)
-        token=create_access_token({"sub": str(user.id)})
+        tokens=TokenService.issue_tokens(db, user.id)
         return {
-        "access_token": token,
-        "token_type": "bearer",
+        **tokens,
         "user": user
     }
     except ValueError as e:
@@ -47,12 +48,31 @@ def token_login(
         )
         
         user = UserService.authenticate_user(db=db, userdata=user_login)
-        token = create_access_token({"sub": str(user.id)})
+        tokens = TokenService.issue_tokens(db, user.id)
         
         return {
-            "access_token": token,
-            "token_type": "bearer",
+            **tokens,
             "user": user
         }
     except ValueError as e:
-        raise HTTPException(status_code=401, detail=str(e))
\ No newline at end of file
+        raise HTTPException(status_code=401, detail=str(e))
+
+
+@router.post("/refresh", response_model=TokenResponse, status_code=200)
+def refresh(body: RefreshRequest, db: Session = Depends(get_db)):
+    """Rotate a refresh token into a new access/refresh pair"""
+    try:
+        return TokenService.rotate_refresh_token(db, body.refresh_token)
+    except ValueError as e:
+        raise HTTPException(status_code=401, detail=str(e))
+
+
+@router.post("/logout", status_code=204)
+def logout(
+    body: Optional[RefreshRequest] = None,
+    token: str = Depends(oauth2_scheme),
+    db: Session = Depends(get_db)
+):
+    """Revoke the current access token (and the refresh token, if sent)"""
+    payload = decode_access_token(token)
+    TokenService.logout(db, payload, body.refresh_token if body else None)
@@ -0,0 +1,177 @@
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, StreamingResponse
+from sqlalchemy.orm import Session
+from app.core.change_feed import change_feed
+from app.core.http_cache import cache_headers, is_not_modified, last_modified, make_etag, not_modified
+from app.core.security import get_current_user
+from app.dependencies import get_db
+from app.models.user import User
+from app.schemas.organizations import MemberResponse, OrganizationResponse
+from app.schemas.sync import MemberChanges, OrganizationChanges
+from app.services.organization_service import OrganizationService
+from app.services.read_repository import ReadRepository, parse_fields
+from app.services.sync_service import CursorExpired, SyncService, decode_cursor, new_cursor
+
+router = APIRouter(
+    prefix="/organizations",
+    tags=["Organizations"]
+)
+
+FIELDS_DESCRIPTION = "Comma-separated subset of response fields to return"
+SINCE_DESCRIPTION = "Sync cursor: return only changes since it (from X-Sync-Cursor or a previous delta)"
+SYNC_CURSOR_HEADER = "X-Sync-Cursor"
+
+
+def _parse_since(since: Optional[str]):
+    if since is None:
+        return None
+    try:
+        return decode_cursor(since)
+    except CursorExpired as e:
+        raise HTTPException(status_code=410, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+def _changes(schema, item_schema, rows, removed, cursor, selected) -> JSONResponse:
+    upserted = [row.as_dict() if selected is not None else item_schema.model_validate(row) for row in rows]
+    body = schema(upserted=upserted, removed=removed, cursor=cursor)
+    return JSONResponse(jsonable_encoder(body), headers={SYNC_CURSOR_HEADER: cursor})
+
+
+@router.get("", response_model=List[OrganizationResponse])
+def list_my_organizations(
+    response: Response,
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+    since: Optional[str] = Query(None, description=SINCE_DESCRIPTION),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Organizations the current user belongs to, with their role.
+
+    The X-Sync-Cursor header can be passed back as since= to get an
+    OrganizationChanges delta instead of the full list.
+    """
+    try:
+        selected = parse_fields(fields, OrganizationResponse)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    changed_since = _parse_since(since)
+    cursor = new_cursor()
+
+    if changed_since is not None:
+        rows, removed = SyncService.organization_changes(db, current_user.id, changed_since, selected)
+        return _changes(OrganizationChanges, OrganizationResponse, rows, removed, cursor, selected)
+
+    rows = ReadRepository.get_user_organizations(db, current_user.id, selected)
+    if selected is not None:
+        return JSONResponse(jsonable_encoder([row.as_dict() for row in rows]), headers={SYNC_CURSOR_HEADER: cursor})
+    response.headers[SYNC_CURSOR_HEADER] = cursor
+    return rows
+
+
+@router.get("/{slug}", response_model=OrganizationResponse)
+def get_organization(
+    slug: str,
+    request: Request,
+    response: Response,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Get an organization the current user belongs to"""
+    version = OrganizationService.get_organization_version_by_slug(db, slug)
+    if not version:
+        raise HTTPException(status_code=404, detail="Organization not found")
+    org_id, created_at, updated_at = version
+
+    role = OrganizationService.get_user_role_in_org(db, current_user.id, org_id)
+    if role is None:
+        raise HTTPException(status_code=404, detail="Organization not found")
+
+    # The body includes the caller's role, so it is part of the validator
+    modified = last_modified(created_at, updated_at)
+    headers = cache_headers(make_etag("org", org_id, role, modified), modified)
+    if is_not_modified(request, headers["ETag"], modified):
+        return not_modified(headers)
+
+    org = OrganizationService.get_organization_by_slug(db, slug)
+    if not org:
+        raise HTTPException(status_code=404, detail="Organization not found")
+    response.headers.update(headers)
+
+    result = OrganizationResponse.model_validate(org)
+    result.current_user_role = role
+    return result
+
+
+@router.get("/{slug}/members", response_model=List[MemberResponse])
+def list_members(
+    slug: str,
+    response: Response,
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+    since: Optional[str] = Query(None, description=SINCE_DESCRIPTION),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Members of an organization the current user belongs to.
+
+    The X-Sync-Cursor header can be passed back as since= to get a
+    MemberChanges delta instead of the full list.
+    """
+    try:
+        selected = parse_fields(fields, MemberResponse)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    changed_since = _parse_since(since)
+    cursor = new_cursor()
+
+    version = OrganizationService.get_organization_version_by_slug(db, slug)
+    if not version or OrganizationService.get_user_role_in_org(db, current_user.id, version[0]) is None:
+        raise HTTPException(status_code=404, detail="Organization not found")
+
+    if changed_since is not None:
+        rows, removed = SyncService.member_changes(db, version[0], changed_since, selected)
+        return _changes(MemberChanges, MemberResponse, rows, removed, cursor, selected)
+
+    rows = ReadRepository.get_organization_members(db, version[0], selected)
+    if selected is not None:
+        return JSONResponse(jsonable_encoder([row.as_dict() for row in rows]), headers={SYNC_CURSOR_HEADER: cursor})
+    response.headers[SYNC_CURSOR_HEADER] = cursor
+    return rows
+
+
+@router.get("/{slug}/members/stream")
+def stream_member_changes(
+    slug: str,
+    request: Request,
+    last_event_id: Optional[int] = Query(None, description="Resume after this event id"),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Server-Sent Events stream of member.added / member.removed /
+    member.role_updated changes. Reconnecting clients resume from the
+    Last-Event-ID header (or last_event_id); a "reset" event means
+    changes were missed and the member list should be refetched. The
+    stream ends once the caller is no longer a member.
+    """
+    version = OrganizationService.get_organization_version_by_slug(db, slug)
+    if not version or OrganizationService.get_user_role_in_org(db, current_user.id, version[0]) is None:
+        raise HTTPException(status_code=404, detail="Organization not found")
+
+    header = request.headers.get("last-event-id")
+    if header is not None and header.isdigit():
+        last_event_id = int(header)
+
+    # Give the connection back now - the stream can stay open for hours
+    db.close()
+
+    return StreamingResponse(
+        change_feed.subscribe(version[0], last_event_id, user_id=current_user.id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
@@ -0,0 +1,51 @@
+import math
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+from app.core.security import get_current_user
+from app.dependencies import get_db
+from app.models.user import User
+from app.schemas.organizations import OrganizationResponse
+from app.schemas.pagination import PageParams, PaginatedResponse
+from app.schemas.user import UserResponse
+from app.services.search_service import SearchService
+
+router = APIRouter(
+    prefix="/search",
+    tags=["Search"]
+)
+
+
+def _page(items, total: int, params: PageParams) -> dict:
+    return {
+        "items": items,
+        "total": total,
+        "page": params.page,
+        "size": params.size,
+        "pages": math.ceil(total / params.size) if total else 0
+    }
+
+
+@router.get("/users", response_model=PaginatedResponse[UserResponse])
+def search_users(
+    q: str = Query(..., min_length=1, max_length=100, description="Name, username or email prefix"),
+    params: PageParams = Depends(),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Find users to invite by name, username or email"""
+    users, total = SearchService.search_users(db, q, params.page, params.size)
+    return _page(users, total, params)
+
+
+@router.get("/organizations", response_model=PaginatedResponse[OrganizationResponse])
+def search_organizations(
+    q: str = Query(..., min_length=1, max_length=100, description="Organization name or slug prefix"),
+    params: PageParams = Depends(),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Search the organizations the current user belongs to"""
+    orgs, total = SearchService.search_organizations(
+        db, q, params.page, params.size, member_id=current_user.id
+    )
+    return _page(orgs, total, params)
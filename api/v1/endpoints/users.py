@@ -1,8 +1,13 @@
-from fastapi import APIRouter,Depends,HTTPException
+from typing import List, Optional
+from fastapi import APIRouter,Depends,HTTPException,Query,Request,Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from app.core.http_cache import cache_headers, is_not_modified, last_modified, make_etag, not_modified
 from app.core.security import get_current_user
 from app.schemas.user import UserResponse,UserUpdate
 from app.models.user import User
 from app.services.user_service import UserService
+from app.services.read_repository import ReadRepository, parse_fields
 from sqlalchemy.orm import Session 
 from app.dependencies import get_db
 
@@ -11,8 +16,30 @@ router = APIRouter(
     tags=["Users"]
 )
 
+MAX_BATCH_IDS = 100
+
+@router.get("", response_model=List[UserResponse])
+def get_users(ids: str = Query(..., description="Comma-separated user ids, e.g. 1,2,3"),
+              db: Session = Depends(get_db),
+              current_user: User = Depends(get_current_user)):
+    try:
+        user_ids = [int(part) for part in ids.split(",") if part.strip()]
+    except ValueError:
+        raise HTTPException(status_code=400, detail="ids must be comma-separated integers")
+    if not user_ids:
+        raise HTTPException(status_code=400, detail="At least one id is required")
+    if len(user_ids) > MAX_BATCH_IDS:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_BATCH_IDS} ids per request")
+    # Duplicates are collapsed; the response follows the order of first appearance
+    return UserService.get_users_by_ids(db, list(dict.fromkeys(user_ids)))
+
 @router.get("/me" , response_model=UserResponse)
-def get_my_profile(current_user: User = Depends(get_current_user)) :
+def get_my_profile(request: Request, response: Response, current_user: User = Depends(get_current_user)) :
+    modified = last_modified(current_user.created_at, current_user.updated_at)
+    headers = cache_headers(make_etag("user", current_user.id, modified), modified)
+    if is_not_modified(request, headers["ETag"], modified):
+        return not_modified(headers)
+    response.headers.update(headers)
     return current_user
 
 @router.patch("/me", response_model=UserResponse)
@@ -28,8 +55,27 @@ def update_my_profile(updates:UserUpdate ,
         raise HTTPException(status_code=400, detail=str(e))
     
 @router.get("/{user_id}", response_model=UserResponse)
-def get_user_profile(user_id : int , db: Session = Depends(get_db)):
-    user = UserService.get_user_by_id(db, user_id)
+def get_user_profile(user_id : int , request: Request, response: Response,
+                     fields: Optional[str] = Query(None, description="Comma-separated subset of response fields to return"),
+                     db: Session = Depends(get_db)):
+    try:
+        selected = parse_fields(fields, UserResponse)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    # Validate against the timestamps first; only load the row on a miss
+    version = UserService.get_user_version(db, user_id)
+    if not version:
+        raise HTTPException(status_code=404, detail="User not found")
+    modified = last_modified(*version)
+    headers = cache_headers(make_etag("user", user_id, modified), modified)
+    if is_not_modified(request, headers["ETag"], modified):
+        return not_modified(headers)
+
+    user = ReadRepository.get_user(db, user_id, selected)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
-    return user
\ No newline at end of file
+    if selected is not None:
+        return JSONResponse(jsonable_encoder(user.as_dict()), headers=headers)
+    response.headers.update(headers)
+    return user
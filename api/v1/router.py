@@ -1,6 +1,12 @@
 from fastapi import APIRouter
 from app.api.v1.endpoints import auth
 from app.api.v1.endpoints import users
+from app.api.v1.endpoints import search
+from app.api.v1.endpoints import admin
+from app.api.v1.endpoints import organizations
 api_router=APIRouter()
 api_router.include_router(auth.router)
-api_router.include_router(users.router)
\ No newline at end of file
+api_router.include_router(users.router)
+api_router.include_router(organizations.router)
+api_router.include_router(search.router)
+api_router.include_router(admin.router)
\ No newline at end of file
@@ -0,0 +1,120 @@
+"""
+Memory and throughput of the ORM read path vs. ReadRepository.
+
+Runs against an in-memory SQLite database seeded with one organization
+and N members, and times building the MemberResponse list both ways.
+
+Usage (from the directory containing the app package):
+
+    python -m app.benchmarks.read_repository --members 20000 --repeat 5
+"""
+import argparse
+import gc
+import os
+import time
+import tracemalloc
+
+os.environ.setdefault("DATABASE_URL", "sqlite:///:memory:")
+os.environ.setdefault("SECRET_KEY", "benchmark")
+
+from sqlalchemy import insert
+
+from app.core.database import Base, SessionLocal, engine
+from app.models.oragization import Organization
+from app.models.organizationmember import OrganizationMember
+from app.models.user import User
+from app.schemas.organizations import MemberResponse
+from app.services.organization_service import OrganizationService
+from app.services.read_repository import ReadRepository
+
+
+def seed(members: int) -> int:
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        conn.execute(insert(User.__table__), [
+            {
+                "username": f"user{i}",
+                "email": f"user{i}@example.com",
+                "full_name": f"User {i}",
+                "hashed_password": "x",
+                "is_active": True,
+                "is_superuser": False,
+            }
+            for i in range(1, members + 1)
+        ])
+        org_id = conn.execute(insert(Organization.__table__).values(
+            name="Bench", slug="bench", plan="free", is_active=True
+        )).inserted_primary_key[0]
+        conn.execute(insert(OrganizationMember.__table__), [
+            {
+                "user_id": i,
+                "organization_id": org_id,
+                "role": "member",
+                "invited_by_id": 1 if i > 1 else None,
+            }
+            for i in range(1, members + 1)
+        ])
+    return org_id
+
+
+def orm_path(org_id: int) -> list:
+    db = SessionLocal()
+    try:
+        return [
+            MemberResponse(
+                user_id=user.id,
+                username=user.username,
+                email=user.email,
+                role=member.role,
+                joined_at=member.joined_at,
+                invited_by=member.invited_by.username if member.invited_by else None,
+            )
+            for user, member in OrganizationService.get_organization_members(db, org_id)
+        ]
+    finally:
+        db.close()
+
+
+def core_path(org_id: int) -> list:
+    db = SessionLocal()
+    try:
+        return [
+            MemberResponse.model_validate(row)
+            for row in ReadRepository.get_organization_members(db, org_id)
+        ]
+    finally:
+        db.close()
+
+
+def measure(fn, org_id: int, repeat: int):
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        result = fn(org_id)
+        best = min(best, time.perf_counter() - start)
+
+    gc.collect()
+    tracemalloc.start()
+    result = fn(org_id)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak, len(result)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--members", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    org_id = seed(args.members)
+    print(f"{args.members} members, best of {args.repeat}")
+    print(f"{'path':<8}{'seconds':>10}{'rows/s':>12}{'peak MiB':>10}")
+    for name, fn in (("orm", orm_path), ("core", core_path)):
+        seconds, peak, rows = measure(fn, org_id, args.repeat)
+        print(f"{name:<8}{seconds:>10.3f}{rows / seconds:>12.0f}{peak / 2**20:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,75 @@
+from typing import Optional
 from pydantic_settings import BaseSettings
 class Settings (BaseSettings):
     APP_NAME : str = "TaskFlow"
     APP_VERSION: str = "1.0.0"
     DATABASE_URL : str
     DEBUG : bool = False
+    # Connection pool (ignored for SQLite)
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30.0
+    # Threads for sync endpoints; defaults to DB_POOL_SIZE + DB_MAX_OVERFLOW
+    THREADPOOL_SIZE: Optional[int] = None
+    # Adaptive concurrency limits per route class (auth/read/write)
+    CONCURRENCY_LIMIT_ENABLED: bool = True
+    CONCURRENCY_MIN_LIMIT: int = 1
+    CONCURRENCY_MAX_LIMIT: Optional[int] = None  # total across route classes; defaults to the thread pool size
+    CONCURRENCY_QUEUE_SIZE: int = 100
+    CONCURRENCY_QUEUE_TIMEOUT_SECONDS: float = 1.0
+    # On-demand request profiling (off unless enabled)
+    PROFILING_ENABLED: bool = False
+    PROFILING_SAMPLE_RATE: float = 0.0
+    PROFILING_INTERVAL_MS: float = 1.0
+    PROFILING_OUTPUT_DIR: str = "/tmp/taskflow-profiles"
+    PROFILING_TOKEN_TTL_SECONDS: int = 300
+    # Slow query log
+    SLOW_QUERY_ENABLED: bool = True
+    SLOW_QUERY_THRESHOLD_MS: float = 100.0
+    SLOW_QUERY_LOG_SIZE: int = 500
+    SLOW_QUERY_EXPLAIN: bool = True
+    # Membership change feed (SSE)
+    CHANGE_FEED_HISTORY_SIZE: int = 1000
+    CHANGE_FEED_QUEUE_SIZE: int = 100
+    CHANGE_FEED_HEARTBEAT_SECONDS: float = 15.0
+    CHANGE_FEED_MEMBERSHIP_RECHECK_SECONDS: float = 60.0
+    CHANGE_FEED_HISTORY_TTL_SECONDS: float = 600.0  # idle orgs without subscribers
+    # Delta sync ("since" cursors). Overlap re-sends rows near the cursor to
+    # cover clock skew and late commits; older cursors need a full resync.
+    SYNC_CURSOR_OVERLAP_SECONDS: float = 5.0
+    SYNC_TOMBSTONE_RETENTION_DAYS: int = 30
     # JWT settings
     ALGORITHM: str ="HS256"
     SECRET_KEY: str
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
+    REFRESH_TOKEN_EXPIRE_DAYS: int = 7
+    # Revoked access tokens held in memory (see core/revocation.py)
+    REVOCATION_BLOOM_CAPACITY: int = 100000
+    REVOCATION_BLOOM_ERROR_RATE: float = 0.001
+    REVOCATION_REFRESH_SECONDS: float = 5.0
+    # Per-worker caches and the cross-worker invalidation bus ("unix", "redis" or "none")
+    CACHE_TTL_SECONDS: float = 60.0
+    CACHE_MAX_ENTRIES: int = 10000
+    INVALIDATION_BACKEND: str = "unix"
+    # Unset: a directory under the temp dir unique to this DATABASE_URL, so
+    # two deployments on one host never share a bus
+    INVALIDATION_SOCKET_DIR: Optional[str] = None
+    INVALIDATION_REDIS_URL: Optional[str] = None
+    INVALIDATION_CHANNEL: str = "taskflow:invalidation"
+    # Search settings ("auto" picks a backend from the database dialect)
+    SEARCH_BACKEND: str = "auto"
+    # Background job queue
+    JOB_QUEUE_MAXSIZE: int = 1000
+    JOB_QUEUE_WORKERS: int = 4
+    JOB_MAX_RETRIES: int = 3
+    JOB_RETRY_BACKOFF_SECONDS: float = 0.5
+    JOB_ENQUEUE_TIMEOUT_SECONDS: float = 0.1
+    JOB_DRAIN_TIMEOUT_SECONDS: float = 10.0
+    # Audit log buffering
+    AUDIT_BATCH_SIZE: int = 200
+    AUDIT_FLUSH_INTERVAL_SECONDS: float = 1.0
+    AUDIT_BUFFER_SIZE: int = 5000
+    AUDIT_PUT_TIMEOUT_SECONDS: float = 0.05
 
 
     class Config:
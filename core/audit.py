@@ -0,0 +1,214 @@
+import logging
+import threading
+import time
+from collections import deque
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.core.database import SessionLocal
+from app.models.auditlog import AuditLog
+
+logger = logging.getLogger(__name__)
+
+
+class AuditBuffer:
+    """
+    Collects audit events in memory and writes them in multi-row inserts.
+
+    A background thread flushes whenever max_batch events are waiting or
+    flush_interval seconds have passed, whichever comes first. When the
+    buffer holds max_buffer events, record() blocks for up to put_timeout
+    seconds and then flushes on the caller's thread, so producers slow down
+    instead of events being dropped. Only if that flush fails too (database
+    down) is the oldest event dropped and counted, so the buffer never
+    holds more than max_buffer events.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        max_batch: int,
+        flush_interval: float,
+        max_buffer: int,
+        put_timeout: float
+    ):
+        self.session_factory = session_factory
+        self.max_batch = max_batch
+        self.flush_interval = flush_interval
+        self.max_buffer = max_buffer
+        self.put_timeout = put_timeout
+
+        self._events: deque = deque()
+        self._cond = threading.Condition()
+        self._flush_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._stopping = False
+
+        self.flushed = 0
+        self.flush_count = 0
+        self.flush_errors = 0
+        self.dropped = 0
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None
+
+    def record(
+        self,
+        action: str,
+        organization_id: Optional[int] = None,
+        actor_id: Optional[int] = None,
+        target_user_id: Optional[int] = None,
+        details: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """
+        Buffer one audit event.
+
+        Args:
+            action: What happened, e.g. "member.added"
+            organization_id: Organization the change applies to
+            actor_id: User who made the change
+            target_user_id: User the change was made to
+            details: Extra JSON-serializable context
+        """
+        event = {
+            "action": action,
+            "organization_id": organization_id,
+            "actor_id": actor_id,
+            "target_user_id": target_user_id,
+            "details": details,
+            "occurred_at": datetime.now(timezone.utc),
+        }
+
+        if not self.running:
+            # Nothing will flush for us (scripts, shutdown) - write through
+            self._write([event])
+            return
+
+        with self._cond:
+            if len(self._events) >= self.max_buffer:
+                self._cond.wait_for(
+                    lambda: len(self._events) < self.max_buffer,
+                    timeout=self.put_timeout
+                )
+            overflow = len(self._events) >= self.max_buffer
+
+        if overflow:
+            logger.warning("Audit buffer full, flushing on request thread")
+            self.flush()
+
+        with self._cond:
+            self._events.append(event)
+            self._trim()
+            if len(self._events) >= self.max_batch:
+                self._cond.notify_all()
+
+    def flush(self) -> int:
+        """
+        Write everything currently buffered.
+
+        Returns:
+            Number of events written
+        """
+        written = 0
+        with self._flush_lock:
+            while True:
+                with self._cond:
+                    batch = [
+                        self._events.popleft()
+                        for _ in range(min(self.max_batch, len(self._events)))
+                    ]
+                    self._cond.notify_all()
+                if not batch:
+                    break
+                if not self._write(batch):
+                    # Keep the events for the next attempt, oldest first
+                    with self._cond:
+                        self._events.extendleft(reversed(batch))
+                        self._trim()
+                    break
+                written += len(batch)
+        return written
+
+    def start(self) -> None:
+        """Start the background flusher thread."""
+        if self.running:
+            return
+        self._stopping = False
+        self._thread = threading.Thread(target=self._run, name="audit-flusher", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the flusher and write out whatever is still buffered."""
+        if not self.running:
+            return
+        with self._cond:
+            self._stopping = True
+            self._cond.notify_all()
+        self._thread.join()
+        self._thread = None
+        self.flush()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "buffered": len(self._events),
+            "capacity": self.max_buffer,
+            "flushed": self.flushed,
+            "flushes": self.flush_count,
+            "flush_errors": self.flush_errors,
+            "dropped": self.dropped,
+        }
+
+    def _trim(self) -> None:
+        # Caller holds self._cond. Oldest events go first.
+        excess = len(self._events) - self.max_buffer
+        if excess <= 0:
+            return
+        for _ in range(excess):
+            self._events.popleft()
+        self.dropped += excess
+        logger.error("Audit buffer full and not flushing, dropped %d oldest events", excess)
+
+    def _run(self) -> None:
+        deadline = time.monotonic() + self.flush_interval
+        while True:
+            with self._cond:
+                self._cond.wait_for(
+                    lambda: self._stopping or len(self._events) >= self.max_batch,
+                    timeout=max(0.0, deadline - time.monotonic())
+                )
+                if self._stopping:
+                    return
+            self.flush()
+            deadline = time.monotonic() + self.flush_interval
+
+    def _write(self, events: List[Dict[str, Any]]) -> bool:
+        db = self.session_factory()
+        try:
+            # One INSERT ... VALUES (...), (...), ... per batch
+            db.execute(insert(AuditLog.__table__).values(events))
+            db.commit()
+        except Exception:
+            db.rollback()
+            self.flush_errors += 1
+            logger.exception("Failed to write %d audit events", len(events))
+            return False
+        finally:
+            db.close()
+
+        self.flushed += len(events)
+        self.flush_count += 1
+        return True
+
+
+audit_log = AuditBuffer(
+    session_factory=SessionLocal,
+    max_batch=settings.AUDIT_BATCH_SIZE,
+    flush_interval=settings.AUDIT_FLUSH_INTERVAL_SECONDS,
+    max_buffer=settings.AUDIT_BUFFER_SIZE,
+    put_timeout=settings.AUDIT_PUT_TIMEOUT_SECONDS
+)
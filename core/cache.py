@@ -0,0 +1,101 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional
+
+# Returned by LocalCache.get() on a miss (None is a valid cached value)
+MISSING = object()
+
+
+class LocalCache:
+    """
+    Small thread-safe LRU cache with a TTL, local to one worker process.
+
+    Entries are dropped early through the invalidation bus (see
+    core/invalidation.py) when another worker changes the underlying row;
+    the TTL only bounds staleness if an invalidation is ever lost. Since
+    invalidations can be lost, never cache authorization decisions here.
+
+    A reader that misses should take generation() before querying and pass
+    it to set(): if an invalidation ran in between, the value it read may
+    predate the change and is not stored.
+    """
+
+    def __init__(self, name: str, maxsize: int, ttl: float):
+        self.name = name
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def get(self, key: Hashable) -> Any:
+        """
+        Look up a key.
+
+        Returns:
+            Cached value, or MISSING
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None or entry[1] < time.monotonic():
+                if entry is not None:
+                    del self._data[key]
+                self.misses += 1
+                return MISSING
+            self._data.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def generation(self) -> int:
+        """Counter bumped by every invalidation; see set()."""
+        return self._generation
+
+    def set(self, key: Hashable, value: Any, generation: Optional[int] = None) -> None:
+        """
+        Store a value.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+            generation: generation() taken before the value was read; the
+                value is discarded if anything was invalidated since
+        """
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+            self._data[key] = (value, time.monotonic() + self.ttl)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def invalidate(self, key: Hashable) -> None:
+        with self._lock:
+            self._generation += 1
+            if self._data.pop(key, None) is not None:
+                self.invalidations += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._data.clear()
+
+    def on_invalidate(self, event: Dict[str, Any]) -> None:
+        """Invalidation bus handler: drop one key, or everything if key is None."""
+        key: Optional[Hashable] = event.get("key")
+        if key is None:
+            self.clear()
+        else:
+            self.invalidate(key)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+        }
@@ -0,0 +1,327 @@
+import asyncio
+import json
+import logging
+import threading
+import time
+from collections import defaultdict, deque
+from typing import Any, AsyncIterator, Callable, Dict, Optional, Set, Tuple
+
+import anyio.to_thread
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.core.database import SessionLocal
+from app.core.invalidation import invalidation_bus
+from app.models.organizationmember import OrganizationMember
+
+logger = logging.getLogger(__name__)
+
+# (event id, encoded SSE frame, id of the user a member.removed event removes)
+Frame = Tuple[int, bytes, Optional[int]]
+
+# Sent when a subscriber cannot be brought up to date from history
+RESET_FRAME = b"event: reset\ndata: {}\n\n"
+HEARTBEAT_FRAME = b": keep-alive\n\n"
+# Queued to a subscriber whose membership re-check failed
+REVOKED = object()
+
+
+def encode_event(event_id: int, event_type: str, data: Dict[str, Any]) -> bytes:
+    payload = json.dumps(data, separators=(",", ":"), default=str)
+    return f"id: {event_id}\nevent: {event_type}\ndata: {payload}\n\n".encode()
+
+
+def encode_id(event_id: int) -> bytes:
+    # No data, so nothing is dispatched - but the client's Last-Event-ID
+    # still moves to event_id
+    return f"id: {event_id}\n\n".encode()
+
+
+class _History:
+    """Recent frames of one organization."""
+
+    __slots__ = ("frames", "covers_from", "updated")
+
+    def __init__(self, size: int, covers_from: int):
+        self.frames: deque = deque(maxlen=size)
+        # Events before this id may have been evicted with an earlier history
+        self.covers_from = covers_from
+        self.updated = time.monotonic()
+
+
+class ChangeFeed:
+    """
+    Per-organization membership change feed for Server-Sent Events.
+
+    Membership events arrive over the invalidation bus, so every worker
+    sees every change no matter which worker committed it. Event ids are
+    the publisher's timestamp in microseconds, which makes them comparable
+    across workers and lets a client resume on any worker with
+    Last-Event-ID.
+
+    Events from different workers can arrive out of order, so subscribers
+    get every event they have not been sent yet (deduplicated by id), and
+    an out-of-order event is followed by an id-only frame that keeps the
+    client's Last-Event-ID at the highest id delivered.
+
+    Each event is encoded once and the same bytes are queued to every
+    subscriber of the organization. A subscriber whose queue fills up is
+    sent a reset and dropped. On reconnect it resumes from the recent
+    history kept per organization. It gets a reset telling it to refetch
+    when that history does not reach back to its Last-Event-ID: older
+    events were evicted, or they predate this worker's feed. Histories of
+    organizations nobody is subscribed to are dropped after history_ttl
+    seconds without events.
+
+    A removed member's stream ends on the member.removed event. In case
+    the bus lost it, memberships are also re-checked every recheck_interval
+    seconds: one query per organization for all of its subscribers, run
+    in a single worker thread.
+    """
+
+    def __init__(
+        self,
+        history_size: int,
+        queue_size: int,
+        heartbeat: float,
+        recheck_interval: float,
+        history_ttl: float,
+        session_factory: Callable[[], Session] = SessionLocal
+    ):
+        self.history_size = history_size
+        self.queue_size = queue_size
+        self.heartbeat = heartbeat
+        self.recheck_interval = recheck_interval
+        self.history_ttl = history_ttl
+        self.session_factory = session_factory
+
+        self._history: Dict[int, _History] = {}
+        # queue -> subscribed user id, per organization
+        self._subscribers: Dict[int, Dict[asyncio.Queue, Optional[int]]] = defaultdict(dict)
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[int] = None
+        self._sweeper: Optional[asyncio.Task] = None
+        # Events before this id were never seen by this worker
+        self._covers_from = int(time.time() * 1_000_000)
+        # Highest event id among histories dropped as idle
+        self._evicted_upto = 0
+
+        self.published = 0
+        self.dropped_subscribers = 0
+        self.revoked_subscribers = 0
+
+    def start(self) -> None:
+        """Bind to the running event loop (call from a startup handler)."""
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread = threading.get_ident()
+        self._covers_from = int(time.time() * 1_000_000)
+        self._sweeper = self._loop.create_task(self._sweep())
+
+    def on_membership_event(self, event: Dict[str, Any]) -> None:
+        """Invalidation bus handler for the "membership" topic."""
+        data = event.get("data")
+        if not data:
+            return
+        event_id = int(event["ts"] * 1_000_000)
+        self.publish(data["organization_id"], event_id, data["type"], data)
+
+    def publish(self, org_id: int, event_id: int, event_type: str, data: Dict[str, Any]) -> None:
+        """
+        Record an event and push it to the organization's subscribers.
+
+        Safe to call from any thread.
+        """
+        removed_user = data.get("user_id") if event_type == "member.removed" else None
+        frame = (event_id, encode_event(event_id, event_type, data), removed_user)
+        with self._lock:
+            history = self._history.get(org_id)
+            if history is None:
+                history = self._history[org_id] = _History(self.history_size, self._evicted_upto)
+            history.frames.append(frame)
+            history.updated = time.monotonic()
+            self.published += 1
+
+        if self._loop is None:
+            return
+        if threading.get_ident() == self._loop_thread:
+            self._fan_out(org_id, frame)
+        else:
+            self._loop.call_soon_threadsafe(self._fan_out, org_id, frame)
+
+    async def subscribe(
+        self,
+        org_id: int,
+        last_event_id: Optional[int] = None,
+        user_id: Optional[int] = None
+    ) -> AsyncIterator[bytes]:
+        """
+        Stream SSE frames for an organization.
+
+        Args:
+            org_id: Organization ID
+            last_event_id: Resume after this event id (from Last-Event-ID)
+            user_id: Subscriber; the stream ends once they are no longer a
+                member (removal event or periodic re-check)
+
+        Yields:
+            Encoded SSE frames, including keep-alive comments
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        # Register before reading history so nothing falls in between
+        self._subscribers[org_id][queue] = user_id
+        sent: Set[int] = set()
+        sent_order: deque = deque()
+        highest = 0
+
+        def track(event_id: int) -> bool:
+            # False if already sent; remembers the last queue_size + history ids
+            nonlocal highest
+            if event_id in sent:
+                return False
+            sent.add(event_id)
+            sent_order.append(event_id)
+            if len(sent_order) > self.queue_size + self.history_size:
+                sent.discard(sent_order.popleft())
+            highest = max(highest, event_id)
+            return True
+
+        try:
+            if last_event_id is not None:
+                highest = last_event_id
+                with self._lock:
+                    org_history = self._history.get(org_id)
+                    history = list(org_history.frames) if org_history else []
+                    covers_from = org_history.covers_from if org_history else self._evicted_upto
+                evicted = len(history) == self.history_size and min(f[0] for f in history) > last_event_id
+                if evicted or last_event_id < max(self._covers_from, covers_from):
+                    # Events the client missed are not (or no longer) known here
+                    yield RESET_FRAME
+                replayed = None
+                for event_id, frame, removed_user in history:
+                    if event_id > last_event_id and track(event_id):
+                        yield frame
+                        replayed = event_id
+                        if user_id is not None and removed_user == user_id:
+                            return
+                if replayed is not None and replayed < highest:
+                    yield encode_id(highest)
+
+            while True:
+                try:
+                    item = await asyncio.wait_for(queue.get(), timeout=self.heartbeat)
+                except asyncio.TimeoutError:
+                    yield HEARTBEAT_FRAME
+                    continue
+                if item is None:
+                    # Overflowed: we were dropped by _fan_out
+                    yield RESET_FRAME
+                    return
+                if item is REVOKED:
+                    return
+                event_id, frame, removed_user = item
+                if not track(event_id):
+                    continue
+                yield frame
+                if event_id < highest:
+                    yield encode_id(highest)
+                if user_id is not None and removed_user == user_id:
+                    # No longer a member - nothing more for this client
+                    return
+        finally:
+            subscribers = self._subscribers.get(org_id)
+            if subscribers is not None:
+                subscribers.pop(queue, None)
+                if not subscribers:
+                    self._subscribers.pop(org_id, None)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "organizations": len(self._subscribers),
+            "histories": len(self._history),
+            "subscribers": sum(len(s) for s in self._subscribers.values()),
+            "published": self.published,
+            "dropped_subscribers": self.dropped_subscribers,
+            "revoked_subscribers": self.revoked_subscribers,
+        }
+
+    def _fan_out(self, org_id: int, frame: Frame) -> None:
+        # Runs on the event loop thread
+        subscribers = self._subscribers.get(org_id)
+        if not subscribers:
+            return
+        for queue in list(subscribers):
+            try:
+                queue.put_nowait(frame)
+            except asyncio.QueueFull:
+                # Too slow to keep up - make room for the drop marker
+                self._end(org_id, queue, None)
+                self.dropped_subscribers += 1
+
+    def _end(self, org_id: int, queue: asyncio.Queue, marker: Any) -> None:
+        # Unsubscribe and make the marker the next (and last) item read
+        subscribers = self._subscribers.get(org_id)
+        if subscribers is not None:
+            subscribers.pop(queue, None)
+        while not queue.empty():
+            queue.get_nowait()
+        queue.put_nowait(marker)
+
+    async def _sweep(self) -> None:
+        while True:
+            await asyncio.sleep(self.recheck_interval)
+            self._evict_idle_histories()
+            try:
+                await self._recheck_members()
+            except Exception:
+                logger.exception("Change feed membership re-check failed")
+
+    def _evict_idle_histories(self) -> None:
+        cutoff = time.monotonic() - self.history_ttl
+        with self._lock:
+            for org_id, history in list(self._history.items()):
+                if history.updated < cutoff and org_id not in self._subscribers:
+                    del self._history[org_id]
+                    if history.frames:
+                        self._evicted_upto = max(self._evicted_upto, max(f[0] for f in history.frames))
+
+    async def _recheck_members(self) -> None:
+        watched = {
+            org_id: {user_id for user_id in subscribers.values() if user_id is not None}
+            for org_id, subscribers in self._subscribers.items()
+        }
+        watched = {org_id: user_ids for org_id, user_ids in watched.items() if user_ids}
+        if not watched:
+            return
+        members = await anyio.to_thread.run_sync(self._current_members, watched)
+        for org_id, user_ids in members.items():
+            subscribers = self._subscribers.get(org_id, {})
+            for queue, user_id in list(subscribers.items()):
+                if user_id is not None and user_id in watched[org_id] and user_id not in user_ids:
+                    self._end(org_id, queue, REVOKED)
+                    self.revoked_subscribers += 1
+
+    def _current_members(self, watched: Dict[int, Set[int]]) -> Dict[int, Set[int]]:
+        # Worker thread: which of the watched users are still members
+        db = self.session_factory()
+        try:
+            members: Dict[int, Set[int]] = {}
+            for org_id, user_ids in watched.items():
+                rows = db.query(OrganizationMember.user_id).filter(
+                    OrganizationMember.organization_id == org_id,
+                    OrganizationMember.user_id.in_(user_ids)
+                ).all()
+                members[org_id] = {row[0] for row in rows}
+            return members
+        finally:
+            db.close()
+
+
+change_feed = ChangeFeed(
+    history_size=settings.CHANGE_FEED_HISTORY_SIZE,
+    queue_size=settings.CHANGE_FEED_QUEUE_SIZE,
+    heartbeat=settings.CHANGE_FEED_HEARTBEAT_SECONDS,
+    recheck_interval=settings.CHANGE_FEED_MEMBERSHIP_RECHECK_SECONDS,
+    history_ttl=settings.CHANGE_FEED_HISTORY_TTL_SECONDS
+)
+invalidation_bus.subscribe("membership", change_feed.on_membership_event)
@@ -0,0 +1,274 @@
+import asyncio
+import json
+import math
+import time
+from collections import deque
+from typing import Any, Callable, Dict, Optional
+
+import anyio.to_thread
+
+from app.config import settings
+
+# Paths that are never limited (cheap, or must answer under overload)
+EXEMPT_PATHS = ("/health", "/docs", "/redoc", "/openapi.json")
+
+# Share of the concurrency budget each route class may use. The class
+# limits add up to the budget, so admitted requests never outnumber the
+# threads (and DB connections) that serve them.
+ROUTE_CLASS_SHARES = {"auth": 0.2, "read": 0.5, "write": 0.3}
+
+
+def thread_pool_size() -> int:
+    """Worker threads for sync endpoints: one per pooled DB connection by default."""
+    return settings.THREADPOOL_SIZE or (settings.DB_POOL_SIZE + settings.DB_MAX_OVERFLOW)
+
+
+def configure_thread_pool() -> None:
+    """
+    Resize anyio's default thread limiter (40 tokens) used for sync routes.
+
+    Must run inside the event loop, e.g. from a startup handler.
+    """
+    anyio.to_thread.current_default_thread_limiter().total_tokens = thread_pool_size()
+
+
+class AdaptiveLimiter:
+    """
+    Concurrency limit that adapts to observed latency.
+
+    Follows the gradient approach: a slow moving average of latency
+    approximates the no-load latency, a fast one tracks the current
+    latency, and their ratio shrinks the limit as queueing builds up. A
+    sqrt(limit) allowance lets the limit probe upward when things are
+    healthy.
+
+    Requests over the limit wait in a bounded FIFO queue until a slot
+    frees up or their deadline passes. Used only from the event loop
+    thread, so no locking is needed.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        initial_limit: int,
+        min_limit: int,
+        max_limit: int,
+        queue_size: int,
+        tolerance: float = 1.5,
+        smoothing: float = 0.2
+    ):
+        self.name = name
+        self.limit = float(initial_limit)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.queue_size = queue_size
+        self.tolerance = tolerance
+        self.smoothing = smoothing
+
+        self.in_flight = 0
+        self._waiters: deque = deque()
+
+        # Latency averages (seconds)
+        self._short_rtt: Optional[float] = None
+        self._long_rtt: Optional[float] = None
+
+        self.accepted = 0
+        self.rejected = 0
+
+    async def acquire(self, deadline: float) -> bool:
+        """
+        Wait for a slot.
+
+        Args:
+            deadline: loop.time() after which the request is rejected
+
+        Returns:
+            True if a slot was acquired, False if rejected
+        """
+        if self.in_flight < int(self.limit) and not self._waiters:
+            self.in_flight += 1
+            self.accepted += 1
+            return True
+
+        if len(self._waiters) >= self.queue_size:
+            self.rejected += 1
+            return False
+
+        loop = asyncio.get_running_loop()
+        waiter = loop.create_future()
+        self._waiters.append(waiter)
+        try:
+            await asyncio.wait_for(waiter, timeout=max(0.0, deadline - loop.time()))
+        except asyncio.TimeoutError:
+            # _wake() may have handed us the slot in the same iteration the
+            # deadline hit (wait_for still raises on 3.12+); keep it, or the
+            # slot would never be released
+            if not (waiter.done() and not waiter.cancelled()):
+                self.rejected += 1
+                return False
+        finally:
+            if not waiter.done() or waiter.cancelled():
+                try:
+                    self._waiters.remove(waiter)
+                except ValueError:
+                    pass
+
+        self.accepted += 1
+        return True
+
+    def release(self, latency: float) -> None:
+        """
+        Give a slot back and feed the request's latency into the limit.
+
+        Args:
+            latency: Seconds the request spent holding the slot
+        """
+        self.in_flight -= 1
+        self._update(latency)
+        self._wake()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "limit": int(self.limit),
+            "in_flight": self.in_flight,
+            "queued": len(self._waiters),
+            "accepted": self.accepted,
+            "rejected": self.rejected,
+            "latency_ms": (self._short_rtt or 0.0) * 1000,
+            "baseline_ms": (self._long_rtt or 0.0) * 1000,
+        }
+
+    def _update(self, latency: float) -> None:
+        if self._short_rtt is None:
+            self._short_rtt = self._long_rtt = latency
+            return
+        self._short_rtt = self._short_rtt * 0.9 + latency * 0.1
+        self._long_rtt = self._long_rtt * 0.995 + latency * 0.005
+
+        # Let the baseline recover quickly after a latency spike passes
+        if self._long_rtt > self._short_rtt * 2:
+            self._long_rtt *= 0.95
+
+        gradient = max(0.5, min(1.0, self.tolerance * self._long_rtt / self._short_rtt))
+        target = self.limit * gradient + math.sqrt(self.limit)
+        limit = self.limit * (1 - self.smoothing) + target * self.smoothing
+        self.limit = max(float(self.min_limit), min(float(self.max_limit), limit))
+
+    def _wake(self) -> None:
+        while self._waiters and self.in_flight < int(self.limit):
+            waiter = self._waiters.popleft()
+            if waiter.done():
+                continue
+            self.in_flight += 1
+            waiter.set_result(None)
+
+
+def classify_request(scope: Dict[str, Any]) -> Optional[str]:
+    """
+    Map a request to its route class, or None if it is not limited.
+
+    Auth gets its own class because bcrypt makes it far slower than other
+    writes; reads are kept apart so slow writes cannot starve them.
+    """
+    path = scope["path"]
+    # Event streams stay open indefinitely and would pin a slot each
+    if path in EXEMPT_PATHS or path.endswith("/stream"):
+        return None
+    if path.startswith("/api/v1/auth"):
+        return "auth"
+    if scope["method"] in ("GET", "HEAD", "OPTIONS"):
+        return "read"
+    return "write"
+
+
+def split_budget(total: int, shares: Dict[str, float]) -> Dict[str, int]:
+    """
+    Divide a concurrency budget between route classes.
+
+    Every class gets at least one slot; the rest follows the shares, with
+    rounding leftovers going to the largest shares. The result adds up to
+    total whenever total >= len(shares).
+    """
+    budget = {name: max(1, int(total * share)) for name, share in shares.items()}
+    for name in sorted(shares, key=shares.get, reverse=True):
+        if sum(budget.values()) >= total:
+            break
+        budget[name] += 1
+    return budget
+
+
+def create_limiters() -> Dict[str, AdaptiveLimiter]:
+    """One limiter per route class, splitting the thread pool between them."""
+    total = settings.CONCURRENCY_MAX_LIMIT or thread_pool_size()
+    limiters = {}
+    for name, max_limit in split_budget(total, ROUTE_CLASS_SHARES).items():
+        min_limit = min(settings.CONCURRENCY_MIN_LIMIT, max_limit)
+        limiters[name] = AdaptiveLimiter(
+            name=name,
+            initial_limit=max(min_limit, max_limit // 2),
+            min_limit=min_limit,
+            max_limit=max_limit,
+            queue_size=settings.CONCURRENCY_QUEUE_SIZE
+        )
+    return limiters
+
+
+class ConcurrencyLimitMiddleware:
+    """
+    ASGI middleware bounding in-flight requests per route class.
+
+    Requests that cannot get a slot before CONCURRENCY_QUEUE_TIMEOUT_SECONDS
+    get an immediate 503 with Retry-After, instead of queueing invisibly in
+    the thread pool and timing out all at once.
+    """
+
+    def __init__(
+        self,
+        app,
+        limiters: Dict[str, AdaptiveLimiter],
+        classify: Callable[[Dict[str, Any]], Optional[str]] = classify_request,
+        queue_timeout: float = 1.0
+    ):
+        self.app = app
+        self.limiters = limiters
+        self.classify = classify
+        self.queue_timeout = queue_timeout
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        route_class = self.classify(scope)
+        limiter = self.limiters.get(route_class) if route_class else None
+        if limiter is None:
+            await self.app(scope, receive, send)
+            return
+
+        loop = asyncio.get_running_loop()
+        if not await limiter.acquire(loop.time() + self.queue_timeout):
+            await self._reject(send)
+            return
+
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            limiter.release(time.perf_counter() - started)
+
+    @staticmethod
+    async def _reject(send) -> None:
+        body = json.dumps({"detail": "Server is overloaded, retry later"}).encode()
+        await send({
+            "type": "http.response.start",
+            "status": 503,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+                (b"retry-after", b"1"),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
+
+
+route_limiters = create_limiters()
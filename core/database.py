@@ -1,15 +1,58 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, inspect
+from sqlalchemy.engine import make_url
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.schema import CreateIndex
 from sqlalchemy.ext.declarative import declarative_base
 from app.config import settings
 DATABASE_URL=settings.DATABASE_URL
-engine = create_engine(DATABASE_URL)
+engine_options = {}
+if make_url(DATABASE_URL).get_backend_name() != "sqlite":
+    # One connection per request thread (see core/concurrency.thread_pool_size)
+    engine_options.update(
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_pre_ping=True
+    )
+engine = create_engine(DATABASE_URL, **engine_options)
 SessionLocal=sessionmaker(autoflush=False,autocommit=False,bind=engine)
 Base=declarative_base()
 def create_db_and_tables():
     print("Creating database tables...")
     Base.metadata.create_all(bind=engine)
+    upgrade_schema()
     print("Tables created successfully.")
+def upgrade_schema():
+    """
+    Bring tables that already exist up to the models.
+
+    create_all only creates missing tables, so this adds missing nullable
+    columns (e.g. organizations.members_changed_at) and missing indexes.
+    Anything else - NOT NULL columns, type changes - needs a hand-written
+    migration and raises.
+    """
+    inspector = inspect(engine)
+    quote = engine.dialect.identifier_preparer.quote
+    with engine.begin() as conn:
+        for table in Base.metadata.sorted_tables:
+            if not inspector.has_table(table.name):
+                continue
+            existing = {column["name"] for column in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name in existing:
+                    continue
+                if not column.nullable or column.server_default is not None:
+                    raise RuntimeError(
+                        f"Column {table.name}.{column.name} cannot be added automatically"
+                    )
+                print(f"Adding column {table.name}.{column.name}")
+                conn.exec_driver_sql(
+                    f"ALTER TABLE {quote(table.name)} ADD COLUMN {quote(column.name)} "
+                    f"{column.type.compile(dialect=engine.dialect)}"
+                )
+            for index in table.indexes:
+                # IF NOT EXISTS rather than reflection, which skips lower(...) indexes
+                conn.execute(CreateIndex(index, if_not_exists=True))
 def get_db():
     db =SessionLocal()
     try:
@@ -0,0 +1,102 @@
+from typing import Any, Callable, Dict, Generic, Hashable, Iterable, List, Optional, TypeVar
+
+from sqlalchemy.orm import Session
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class Pending(Generic[K, V]):
+    """A value promised by DataLoader.load(); resolved on first result() call."""
+
+    __slots__ = ("_loader", "key")
+
+    def __init__(self, loader: "DataLoader[K, V]", key: K):
+        self._loader = loader
+        self.key = key
+
+    def result(self) -> Optional[V]:
+        return self._loader._resolve(self.key)
+
+
+class DataLoader(Generic[K, V]):
+    """
+    Collects keys and fetches them in one batch.
+
+    load() only records the key. The first result() on any pending value
+    fetches every key recorded so far with a single batch_fn call, so N
+    loads followed by N results cost one query. Results (including misses)
+    are cached for the loader's lifetime, which is one request - see
+    get_loader().
+    """
+
+    def __init__(
+        self,
+        batch_fn: Callable[[List[K]], Dict[K, V]],
+        max_batch_size: int = 500
+    ):
+        self.batch_fn = batch_fn
+        self.max_batch_size = max_batch_size
+        self._cache: Dict[K, Optional[V]] = {}
+        self._queue: Dict[K, None] = {}  # insertion-ordered set
+        self.batches = 0
+
+    def load(self, key: K) -> Pending[K, V]:
+        """Schedule a key for the next batch."""
+        if key not in self._cache:
+            self._queue[key] = None
+        return Pending(self, key)
+
+    def load_many(self, keys: Iterable[K]) -> List[Optional[V]]:
+        """Load several keys at once and return their values in order."""
+        pending = [self.load(key) for key in keys]
+        return [p.result() for p in pending]
+
+    def prime(self, key: K, value: Optional[V]) -> None:
+        """Put a known value in the cache (e.g. right after creating it)."""
+        self._cache[key] = value
+
+    def clear(self, key: K) -> None:
+        self._cache.pop(key, None)
+
+    def dispatch(self) -> None:
+        """Fetch every queued key."""
+        queue, self._queue = list(self._queue), {}
+        for start in range(0, len(queue), self.max_batch_size):
+            chunk = queue[start:start + self.max_batch_size]
+            found = self.batch_fn(chunk)
+            self.batches += 1
+            for key in chunk:
+                self._cache[key] = found.get(key)
+
+    def _resolve(self, key: K) -> Optional[V]:
+        if key not in self._cache:
+            self._queue[key] = None
+            self.dispatch()
+        return self._cache[key]
+
+
+def get_loader(
+    db: Session,
+    name: str,
+    batch_fn_factory: Callable[[Session], Callable[[List[Any]], Dict[Any, Any]]]
+) -> DataLoader:
+    """
+    Get the loader called `name` for this session, creating it on first use.
+
+    Sessions are opened per request by get_db, so keeping loaders in
+    Session.info makes them request-scoped with no extra plumbing.
+
+    Args:
+        db: Database session
+        name: Loader name, e.g. "users"
+        batch_fn_factory: Builds the batch function bound to the session
+
+    Returns:
+        The session's DataLoader
+    """
+    loaders = db.info.setdefault("dataloaders", {})
+    loader = loaders.get(name)
+    if loader is None:
+        loader = loaders[name] = DataLoader(batch_fn_factory(db))
+    return loader
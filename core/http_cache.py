@@ -0,0 +1,100 @@
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Dict, Optional
+
+from fastapi import Request, Response
+
+
+def _as_utc(value: datetime) -> datetime:
+    # SQLite hands back naive datetimes; they are stored as UTC
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def last_modified(created_at: datetime, updated_at: Optional[datetime]) -> datetime:
+    """
+    Last modification time of a row (updated_at is NULL until the first update).
+
+    Args:
+        created_at: BaseModel.created_at
+        updated_at: BaseModel.updated_at
+
+    Returns:
+        Timezone-aware UTC datetime
+    """
+    return _as_utc(updated_at or created_at)
+
+
+def make_etag(*parts) -> str:
+    """
+    Build a weak ETag from the values that identify a representation.
+
+    Args:
+        *parts: e.g. resource name, id, last modified time
+
+    Returns:
+        Weak ETag header value, e.g. W/"user-5-1700000000123456"
+    """
+    tokens = []
+    for part in parts:
+        if isinstance(part, datetime):
+            part = int(_as_utc(part).timestamp() * 1_000_000)
+        tokens.append(str(part))
+    return 'W/"' + "-".join(tokens) + '"'
+
+
+def cache_headers(etag: str, modified: datetime) -> Dict[str, str]:
+    """
+    Validator headers to send with a 200 or 304.
+
+    Clients may keep the body but must revalidate before reusing it.
+    """
+    return {
+        "ETag": etag,
+        "Last-Modified": format_datetime(modified, usegmt=True),
+        "Cache-Control": "private, no-cache",
+    }
+
+
+def _strip_weak(tag: str) -> str:
+    tag = tag.strip()
+    return tag[2:] if tag.startswith("W/") else tag
+
+
+def is_not_modified(request: Request, etag: str, modified: datetime) -> bool:
+    """
+    Evaluate If-None-Match / If-Modified-Since against the current validators.
+
+    If-None-Match wins when both are present (RFC 9110 13.2.2).
+
+    Args:
+        request: Incoming request
+        etag: Current ETag
+        modified: Current last modified time (UTC)
+
+    Returns:
+        True if the client's copy is still fresh and a 304 should be sent
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        if if_none_match.strip() == "*":
+            return True
+        current = _strip_weak(etag)
+        return any(_strip_weak(tag) == current for tag in if_none_match.split(","))
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        # HTTP dates have one second resolution
+        return modified.replace(microsecond=0) <= _as_utc(since)
+
+    return False
+
+
+def not_modified(headers: Dict[str, str]) -> Response:
+    """Empty 304 response carrying the validators."""
+    return Response(status_code=304, headers=headers)
@@ -0,0 +1,309 @@
+import errno
+import hashlib
+import json
+import logging
+import os
+import socket
+import stat
+import tempfile
+import threading
+import time
+from collections import defaultdict
+from typing import Any, Callable, Dict, List, Optional
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+Handler = Callable[[Dict[str, Any]], None]
+
+
+class BusBackend:
+    """Transport that fans a payload out to every other worker."""
+
+    name = "none"
+
+    def start(self, deliver: Callable[[bytes], None]) -> None:
+        """Begin receiving; call deliver(payload) for each message."""
+
+    def publish(self, payload: bytes) -> None:
+        """Send payload to the other workers."""
+
+    def stop(self) -> None:
+        """Stop receiving and release resources."""
+
+
+class UnixSocketBackend(BusBackend):
+    """
+    Same-host broadcast over Unix datagram sockets.
+
+    Every worker binds <directory>/<pid>.sock; publishing sends one
+    datagram to each other socket in the directory. Sockets left behind
+    by dead workers are removed the first time a send to them fails.
+
+    The directory is the trust boundary: anything that can write to it can
+    inject events and read every broadcast, so it must belong to this user
+    and be private (0700). start() refuses to run otherwise.
+    """
+
+    name = "unix"
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self.path: Optional[str] = None
+        self.dropped = 0
+        self._sock: Optional[socket.socket] = None
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+
+    def start(self, deliver):
+        self._secure_directory()
+        # Resolved here, not in __init__, so preloading apps get the worker's pid
+        self.path = os.path.join(self.directory, f"{os.getpid()}.sock")
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+
+        self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        self._sock.bind(self.path)
+        # Wake up periodically so stop() does not hang on a blocked recv
+        self._sock.settimeout(1.0)
+        self._running = True
+        sock = self._sock
+
+        def receive():
+            while self._running:
+                try:
+                    payload = sock.recv(65536)
+                except socket.timeout:
+                    continue
+                except OSError:
+                    break
+                deliver(payload)
+
+        self._thread = threading.Thread(target=receive, name="invalidation-bus", daemon=True)
+        self._thread.start()
+
+    def _secure_directory(self) -> None:
+        os.makedirs(self.directory, mode=0o700, exist_ok=True)
+        info = os.lstat(self.directory)
+        if not stat.S_ISDIR(info.st_mode):
+            raise RuntimeError(f"Invalidation socket dir {self.directory} is not a directory")
+        if info.st_uid != os.getuid():
+            raise RuntimeError(
+                f"Invalidation socket dir {self.directory} is owned by uid {info.st_uid}, "
+                f"not {os.getuid()}; refusing to use it"
+            )
+        if stat.S_IMODE(info.st_mode) & 0o077:
+            os.chmod(self.directory, 0o700)
+
+    def publish(self, payload):
+        try:
+            names = os.listdir(self.directory)
+        except FileNotFoundError:
+            return
+        for name in names:
+            path = os.path.join(self.directory, name)
+            if path == self.path or not name.endswith(".sock"):
+                continue
+            try:
+                self._sock.sendto(payload, socket.MSG_DONTWAIT, path)
+            except (ConnectionRefusedError, FileNotFoundError):
+                # Worker is gone
+                try:
+                    os.unlink(path)
+                except FileNotFoundError:
+                    pass
+            except OSError as e:
+                if e.errno in (errno.EAGAIN, errno.ENOBUFS):
+                    # Receiver is not keeping up; TTLs bound the staleness
+                    self.dropped += 1
+                else:
+                    raise
+
+    def stop(self):
+        self._running = False
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+        try:
+            os.unlink(self.path)
+        except FileNotFoundError:
+            pass
+
+
+class RedisBackend(BusBackend):
+    """
+    Cross-host broadcast over Redis pub/sub.
+
+    Requires the optional ``redis`` package.
+    """
+
+    name = "redis"
+
+    def __init__(self, url: str, channel: str):
+        try:
+            import redis
+        except ImportError:
+            raise RuntimeError("INVALIDATION_BACKEND=redis requires the 'redis' package")
+        self.channel = channel
+        self._client = redis.Redis.from_url(url)
+        self._pubsub = None
+        self._thread = None
+
+    def start(self, deliver):
+        self._pubsub = self._client.pubsub(ignore_subscribe_messages=True)
+        self._pubsub.subscribe(**{self.channel: lambda message: deliver(message["data"])})
+        self._thread = self._pubsub.run_in_thread(sleep_time=1.0, daemon=True)
+
+    def publish(self, payload):
+        self._client.publish(self.channel, payload)
+
+    def stop(self):
+        if self._thread is not None:
+            self._thread.stop()
+            self._thread = None
+        if self._pubsub is not None:
+            self._pubsub.close()
+            self._pubsub = None
+
+
+class InvalidationBus:
+    """
+    Broadcasts "this changed" events between worker processes.
+
+    Services publish after their commit; the event is applied to this
+    worker's handlers immediately and sent to the other workers through
+    the backend, whose receiver thread applies it there. Events carry the
+    sender's wall-clock time so receivers can report propagation lag.
+    """
+
+    def __init__(self, backend: BusBackend):
+        self.backend = backend
+        self.origin = None
+        self._handlers: Dict[str, List[Handler]] = defaultdict(list)
+        self._running = False
+
+        self._lock = threading.Lock()
+        self.published = 0
+        self.received = 0
+        self.errors = 0
+        self._lag_total = 0.0
+        self._lag_max = 0.0
+        self._lag_last = 0.0
+
+    def subscribe(self, topic: str, handler: Handler) -> None:
+        """
+        Call handler(event) for every event on a topic.
+
+        Handlers run on the publishing thread (local events) or the bus
+        receiver thread (remote events), so they must be quick and
+        thread-safe.
+        """
+        self._handlers[topic].append(handler)
+
+    def publish(self, topic: str, key: Any = None, data: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Announce a change to every worker, this one included.
+
+        Args:
+            topic: What kind of thing changed, e.g. "user"
+            key: Which one (JSON-serializable); None means "everything"
+            data: Optional extra payload for subscribers
+        """
+        event = {
+            "topic": topic,
+            "key": key,
+            "data": data,
+            "origin": self.origin,
+            "ts": time.time(),
+        }
+        self._dispatch(event)
+        with self._lock:
+            self.published += 1
+
+        if not self._running:
+            return
+        try:
+            self.backend.publish(json.dumps(event, separators=(",", ":")).encode())
+        except Exception:
+            with self._lock:
+                self.errors += 1
+            logger.exception("Failed to broadcast %s invalidation", topic)
+
+    def start(self) -> None:
+        if self._running:
+            return
+        self.origin = f"{socket.gethostname()}:{os.getpid()}"
+        self.backend.start(self._deliver)
+        self._running = True
+        logger.info("Invalidation bus started (%s backend)", self.backend.name)
+
+    def stop(self) -> None:
+        if not self._running:
+            return
+        self._running = False
+        self.backend.stop()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "backend": self.backend.name,
+                "running": self._running,
+                "published": self.published,
+                "received": self.received,
+                "errors": self.errors,
+                "dropped": getattr(self.backend, "dropped", 0),
+                "lag_avg_ms": self._lag_total / self.received * 1000 if self.received else 0.0,
+                "lag_max_ms": self._lag_max * 1000,
+                "lag_last_ms": self._lag_last * 1000,
+            }
+
+    def _deliver(self, payload: bytes) -> None:
+        try:
+            event = json.loads(payload)
+        except ValueError:
+            logger.warning("Ignoring malformed invalidation payload")
+            return
+        if event.get("origin") == self.origin:
+            # Already applied when we published it
+            return
+
+        lag = max(0.0, time.time() - event.get("ts", time.time()))
+        with self._lock:
+            self.received += 1
+            self._lag_total += lag
+            self._lag_max = max(self._lag_max, lag)
+            self._lag_last = lag
+        self._dispatch(event)
+
+    def _dispatch(self, event: Dict[str, Any]) -> None:
+        for handler in self._handlers.get(event["topic"], ()):
+            try:
+                handler(event)
+            except Exception:
+                with self._lock:
+                    self.errors += 1
+                logger.exception("Invalidation handler failed for %s", event["topic"])
+
+
+def default_socket_dir() -> str:
+    """Per-deployment socket directory: workers sharing a database share a bus."""
+    digest = hashlib.sha256(settings.DATABASE_URL.encode()).hexdigest()[:16]
+    return os.path.join(tempfile.gettempdir(), f"taskflow-invalidation-{digest}")
+
+
+def _create_backend() -> BusBackend:
+    backend = settings.INVALIDATION_BACKEND
+    if backend == "unix":
+        return UnixSocketBackend(settings.INVALIDATION_SOCKET_DIR or default_socket_dir())
+    if backend == "redis":
+        return RedisBackend(settings.INVALIDATION_REDIS_URL, settings.INVALIDATION_CHANNEL)
+    if backend == "none":
+        return BusBackend()
+    raise ValueError(f"Unknown invalidation backend: {backend}")
+
+
+invalidation_bus = InvalidationBus(_create_backend())
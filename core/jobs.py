@@ -0,0 +1,274 @@
+import asyncio
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Job:
+    """A unit of deferred work: a plain (sync) callable plus its arguments"""
+    func: Callable[..., Any]
+    args: tuple = ()
+    kwargs: Dict[str, Any] = field(default_factory=dict)
+    enqueued_at: float = field(default_factory=time.monotonic)
+    attempts: int = 0
+    last_error: Optional[str] = None
+
+    @property
+    def name(self) -> str:
+        return getattr(self.func, "__qualname__", repr(self.func))
+
+
+class JobQueue:
+    """
+    Bounded in-process queue for side effects that must not block a response.
+
+    Jobs are sync callables executed on a dedicated thread pool by asyncio
+    worker tasks. Failed jobs are retried with exponential backoff and end
+    up in a bounded dead-letter list once retries are exhausted.
+
+    Services call enqueue() after their commit; it is safe to call from the
+    request threadpool. When the queue is not running (scripts, shell,
+    shutdown) jobs run inline so no work is silently lost.
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        workers: int,
+        max_retries: int,
+        retry_backoff: float,
+        enqueue_timeout: float,
+        dead_letter_size: int = 1000
+    ):
+        self.maxsize = maxsize
+        self.workers = workers
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.enqueue_timeout = enqueue_timeout
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[int] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._tasks: List[asyncio.Task] = []
+        self._running = False
+
+        self.dead_letters: deque = deque(maxlen=dead_letter_size)
+
+        # Metrics
+        self._lock = threading.Lock()
+        self._enqueued = 0
+        self._completed = 0
+        self._retried = 0
+        self._failed = 0
+        self._rejected = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+        self._run_total = 0.0
+        self._run_max = 0.0
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    async def start(self) -> None:
+        """Create the queue and worker tasks on the running event loop."""
+        if self._running:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread = threading.get_ident()
+        self._queue = asyncio.Queue(maxsize=self.maxsize)
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.workers,
+            thread_name_prefix="job-worker"
+        )
+        self._tasks = [
+            asyncio.create_task(self._worker(), name=f"job-worker-{i}")
+            for i in range(self.workers)
+        ]
+        self._running = True
+        logger.info("Job queue started with %d workers", self.workers)
+
+    async def stop(self, timeout: float) -> None:
+        """
+        Stop accepting jobs and drain what is already queued.
+
+        Args:
+            timeout: Seconds to wait for queued jobs before giving up on them
+        """
+        if not self._running:
+            return
+        self._running = False
+
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout=timeout)
+        except asyncio.TimeoutError:
+            logger.warning(
+                "Job queue drain timed out with %d jobs left", self._queue.qsize()
+            )
+
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+        # Whatever could not be drained is kept for inspection
+        while not self._queue.empty():
+            job = self._queue.get_nowait()
+            job.last_error = "not run before shutdown"
+            self._dead_letter(job)
+
+        self._executor.shutdown(wait=True)
+        logger.info("Job queue stopped")
+
+    def enqueue(self, func: Callable[..., Any], *args, **kwargs) -> bool:
+        """
+        Schedule func(*args, **kwargs) to run off the request path.
+
+        If the queue is full the caller waits up to enqueue_timeout seconds
+        for room (backpressure) before the job is rejected.
+
+        Args:
+            func: Sync callable to run
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
+
+        Returns:
+            True if the job was queued or ran inline, False if rejected
+        """
+        job = Job(func=func, args=args, kwargs=kwargs)
+
+        if not self._running:
+            self._run_inline(job)
+            return True
+
+        if threading.get_ident() == self._loop_thread:
+            # Never block the event loop
+            try:
+                self._queue.put_nowait(job)
+            except asyncio.QueueFull:
+                return self._reject(job)
+        else:
+            try:
+                asyncio.run_coroutine_threadsafe(
+                    asyncio.wait_for(self._queue.put(job), timeout=self.enqueue_timeout),
+                    self._loop
+                ).result()
+            except (asyncio.TimeoutError, RuntimeError):
+                return self._reject(job)
+
+        with self._lock:
+            self._enqueued += 1
+        return True
+
+    def stats(self) -> Dict[str, Any]:
+        """Current queue depth, counters and latency figures (seconds)."""
+        with self._lock:
+            started = self._completed + self._failed
+            return {
+                "running": self._running,
+                "depth": self._queue.qsize() if self._queue else 0,
+                "capacity": self.maxsize,
+                "workers": self.workers,
+                "enqueued": self._enqueued,
+                "completed": self._completed,
+                "retried": self._retried,
+                "failed": self._failed,
+                "rejected": self._rejected,
+                "dead_letters": len(self.dead_letters),
+                "avg_wait": self._wait_total / started if started else 0.0,
+                "max_wait": self._wait_max,
+                "avg_run": self._run_total / started if started else 0.0,
+                "max_run": self._run_max,
+            }
+
+    def _reject(self, job: Job) -> bool:
+        job.last_error = "queue full"
+        self._dead_letter(job)
+        with self._lock:
+            self._rejected += 1
+        logger.error("Job queue full, rejected %s", job.name)
+        return False
+
+    def _dead_letter(self, job: Job) -> None:
+        # Dead letters live for the whole process and only their name and
+        # error are ever reported - drop the arguments, which may carry
+        # credentials (e.g. the password of a rehash job)
+        job.args = ()
+        job.kwargs = {}
+        self.dead_letters.append(job)
+
+    def _run_inline(self, job: Job) -> None:
+        try:
+            job.func(*job.args, **job.kwargs)
+        except Exception as e:
+            job.last_error = repr(e)
+            self._dead_letter(job)
+            logger.exception("Inline job %s failed", job.name)
+
+    async def _worker(self) -> None:
+        while True:
+            job = await self._queue.get()
+            try:
+                await self._execute(job)
+            finally:
+                self._queue.task_done()
+
+    async def _execute(self, job: Job) -> None:
+        wait = time.monotonic() - job.enqueued_at
+        started = time.monotonic()
+
+        while True:
+            job.attempts += 1
+            try:
+                await self._loop.run_in_executor(
+                    self._executor, lambda: job.func(*job.args, **job.kwargs)
+                )
+                succeeded = True
+                break
+            except Exception as e:
+                job.last_error = repr(e)
+                if job.attempts > self.max_retries:
+                    succeeded = False
+                    break
+                delay = self.retry_backoff * (2 ** (job.attempts - 1))
+                logger.warning(
+                    "Job %s failed (attempt %d), retrying in %.2fs: %s",
+                    job.name, job.attempts, delay, job.last_error
+                )
+                with self._lock:
+                    self._retried += 1
+                await asyncio.sleep(delay)
+
+        run = time.monotonic() - started
+        with self._lock:
+            if succeeded:
+                self._completed += 1
+            else:
+                self._failed += 1
+            self._wait_total += wait
+            self._wait_max = max(self._wait_max, wait)
+            self._run_total += run
+            self._run_max = max(self._run_max, run)
+
+        if not succeeded:
+            self._dead_letter(job)
+            logger.error("Job %s moved to dead letters: %s", job.name, job.last_error)
+
+
+job_queue = JobQueue(
+    maxsize=settings.JOB_QUEUE_MAXSIZE,
+    workers=settings.JOB_QUEUE_WORKERS,
+    max_retries=settings.JOB_MAX_RETRIES,
+    retry_backoff=settings.JOB_RETRY_BACKOFF_SECONDS,
+    enqueue_timeout=settings.JOB_ENQUEUE_TIMEOUT_SECONDS
+)
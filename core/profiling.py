@@ -0,0 +1,301 @@
+import hashlib
+import hmac
+import json
+import logging
+import os
+import random
+import sys
+import threading
+import time
+import uuid
+from contextvars import ContextVar
+from types import FrameType
+from typing import Any, Dict, List, Optional, Tuple
+
+import anyio.to_thread
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+PROFILE_HEADER = "x-profile-token"
+
+# Profile of the request currently being handled, if it is being profiled.
+# Context variables follow the request into the threadpool, so SQL hooks
+# running in a worker thread see it too.
+_active_profile: ContextVar[Optional["RequestProfile"]] = ContextVar("active_profile", default=None)
+
+# Leaf frames in these files mean the thread was idle, not working for us
+_IDLE_FILES = ("selectors.py", "threading.py", "queue.py")
+
+FrameKey = Tuple[str, str, int]
+
+
+def create_profile_token(ttl_seconds: int) -> str:
+    """
+    Sign a token that enables profiling for requests carrying it.
+
+    Args:
+        ttl_seconds: How long the token stays valid
+
+    Returns:
+        "<expiry>.<signature>" to send in the X-Profile-Token header
+    """
+    expires = str(int(time.time()) + ttl_seconds)
+    signature = hmac.new(settings.SECRET_KEY.encode(), expires.encode(), hashlib.sha256).hexdigest()
+    return f"{expires}.{signature}"
+
+
+def verify_profile_token(token: str) -> bool:
+    expires, _, signature = token.partition(".")
+    if not expires.isdigit() or int(expires) < time.time():
+        return False
+    expected = hmac.new(settings.SECRET_KEY.encode(), expires.encode(), hashlib.sha256).hexdigest()
+    return hmac.compare_digest(signature, expected)
+
+
+class RequestProfile:
+    """
+    Stack samples and SQL timings for one request.
+
+    A sampler thread snapshots, at a fixed interval, the pool threads
+    currently running a threadpool call made for the request (dependencies,
+    handler, response validation - see install_thread_hooks) and the event
+    loop thread while it is executing this request's coroutine. Other
+    requests' work on the same threads is not sampled.
+    """
+
+    def __init__(self, name: str, interval: float):
+        self.id = f"{time.strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:8]}"
+        self.name = name
+        self.interval = interval
+        self.threads = set()
+        # ProfilingMiddleware.__call__ frame of this request; the loop thread
+        # is only working for us while this frame is on its stack
+        self.loop_thread: Optional[int] = None
+        self.loop_frame: Optional[FrameType] = None
+        self.samples: Dict[int, List[Tuple[float, Tuple[FrameKey, ...]]]] = {}
+        self.sql: List[Dict[str, Any]] = []
+        self.started = 0.0
+        self.duration = 0.0
+        self._stop = threading.Event()
+        self._sampler: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        self.started = time.perf_counter()
+        self._sampler = threading.Thread(target=self._sample, name="profiler", daemon=True)
+        self._sampler.start()
+
+    def stop(self) -> None:
+        self.duration = time.perf_counter() - self.started
+        self._stop.set()
+        self._sampler.join()
+
+    def record_sql(self, statement: str, start: float, end: float) -> None:
+        self.sql.append({
+            "statement": statement,
+            "start_ms": (start - self.started) * 1000,
+            "duration_ms": (end - start) * 1000,
+            "thread": threading.get_ident(),
+        })
+
+    def _sample(self) -> None:
+        while not self._stop.wait(self.interval):
+            offset = time.perf_counter() - self.started
+            frames = sys._current_frames()
+            thread_ids = list(self.threads)
+            if self.loop_thread is not None:
+                thread_ids.append(self.loop_thread)
+            for thread_id in thread_ids:
+                frame = frames.get(thread_id)
+                if frame is None:
+                    continue
+                stack = []
+                ours = thread_id != self.loop_thread
+                while frame is not None:
+                    if frame is self.loop_frame:
+                        ours = True
+                    code = frame.f_code
+                    stack.append((code.co_qualname, code.co_filename, code.co_firstlineno))
+                    frame = frame.f_back
+                if not ours or os.path.basename(stack[0][1]) in _IDLE_FILES:
+                    continue
+                stack.reverse()
+                self.samples.setdefault(thread_id, []).append((offset, tuple(stack)))
+
+    def to_speedscope(self) -> Dict[str, Any]:
+        """
+        Render as a speedscope file (https://www.speedscope.app).
+
+        One sampled profile per thread, plus an evented "SQL" profile where
+        each statement is a span with its real start time and duration.
+        """
+        frames: List[Dict[str, Any]] = []
+        index: Dict[Any, int] = {}
+
+        def frame_id(key, frame) -> int:
+            if key not in index:
+                index[key] = len(frames)
+                frames.append(frame)
+            return index[key]
+
+        end_ms = self.duration * 1000
+        interval_ms = self.interval * 1000
+        profiles = []
+        for thread_id, samples in self.samples.items():
+            profiles.append({
+                "type": "sampled",
+                "name": f"thread {thread_id}",
+                "unit": "milliseconds",
+                "startValue": 0,
+                "endValue": end_ms,
+                "samples": [
+                    [frame_id(f, {"name": f[0], "file": f[1], "line": f[2]}) for f in stack]
+                    for _, stack in samples
+                ],
+                "weights": [interval_ms] * len(samples),
+            })
+
+        if self.sql:
+            events = []
+            for query in sorted(self.sql, key=lambda q: q["start_ms"]):
+                statement = " ".join(query["statement"].split())
+                fid = frame_id(("sql", statement), {"name": statement[:300]})
+                events.append({"type": "O", "frame": fid, "at": query["start_ms"]})
+                events.append({"type": "C", "frame": fid, "at": query["start_ms"] + query["duration_ms"]})
+            profiles.append({
+                "type": "evented",
+                "name": f"SQL ({len(self.sql)} statements)",
+                "unit": "milliseconds",
+                "startValue": 0,
+                "endValue": max(end_ms, events[-1]["at"]),
+                "events": events,
+            })
+
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "name": self.name,
+            "exporter": settings.APP_NAME,
+            "shared": {"frames": frames},
+            "profiles": profiles,
+        }
+
+    def write(self, directory: str) -> str:
+        """Write the speedscope file and return its path."""
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, f"{self.id}.speedscope.json")
+        with open(path, "w") as f:
+            json.dump(self.to_speedscope(), f)
+        logger.info("Wrote profile for %s to %s", self.name, path)
+        return path
+
+
+def install_sql_hooks(engine: Engine) -> None:
+    """Time SQL statements of profiled requests (no-op for other requests)."""
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        if _active_profile.get() is not None:
+            conn.info.setdefault("profile_start", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "handle_error")
+    def _error(context):
+        # A failed statement never reaches _after; drop its start time
+        conn = context.connection
+        if _active_profile.get() is None or conn is None or context.statement is None:
+            return
+        if conn.info.get("profile_start"):
+            conn.info["profile_start"].pop()
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        profile = _active_profile.get()
+        if profile is None or not conn.info.get("profile_start"):
+            return
+        start = conn.info["profile_start"].pop()
+        profile.record_sql(statement, start, time.perf_counter())
+
+
+_run_sync = anyio.to_thread.run_sync
+
+
+async def _profiled_run_sync(func, *args, **kwargs):
+    profile = _active_profile.get()
+    if profile is None:
+        return await _run_sync(func, *args, **kwargs)
+
+    def tracked(*call_args):
+        thread_id = threading.get_ident()
+        profile.threads.add(thread_id)
+        try:
+            return func(*call_args)
+        finally:
+            profile.threads.discard(thread_id)
+
+    return await _run_sync(tracked, *args, **kwargs)
+
+
+def install_thread_hooks() -> None:
+    """
+    Make every threadpool call of a profiled request register its pool
+    thread with the profile for exactly the duration of the call.
+
+    Starlette and FastAPI run sync dependencies, endpoints and response
+    validation through anyio.to_thread.run_sync, looked up at call time.
+    """
+    anyio.to_thread.run_sync = _profiled_run_sync
+
+
+class ProfilingMiddleware:
+    """
+    ASGI middleware that profiles selected requests.
+
+    A request is profiled when it carries a valid X-Profile-Token header
+    (issued to superusers by POST /admin/profile-token) or is picked by
+    PROFILING_SAMPLE_RATE. Profiled responses get an X-Profile-Id header
+    naming the file under PROFILING_OUTPUT_DIR. Only installed when
+    PROFILING_ENABLED is set.
+    """
+
+    def __init__(self, app, sample_rate: float, interval: float, output_dir: str):
+        self.app = app
+        self.sample_rate = sample_rate
+        self.interval = interval
+        self.output_dir = output_dir
+
+    def _wants_profile(self, scope) -> bool:
+        for name, value in scope["headers"]:
+            if name == PROFILE_HEADER.encode():
+                return verify_profile_token(value.decode("latin-1"))
+        return self.sample_rate > 0 and random.random() < self.sample_rate
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not self._wants_profile(scope):
+            await self.app(scope, receive, send)
+            return
+
+        # Imported here: core.jobs is not needed unless something is profiled
+        from app.core.jobs import job_queue
+
+        profile = RequestProfile(f"{scope['method']} {scope['path']}", self.interval)
+        profile.loop_thread = threading.get_ident()
+        profile.loop_frame = sys._getframe()
+        token = _active_profile.set(profile)
+
+        async def send_with_id(message):
+            if message["type"] == "http.response.start":
+                message.setdefault("headers", [])
+                message["headers"] = list(message["headers"]) + [(b"x-profile-id", profile.id.encode())]
+            await send(message)
+
+        profile.start()
+        try:
+            await self.app(scope, receive, send_with_id)
+        finally:
+            profile.stop()
+            profile.loop_frame = None
+            _active_profile.reset(token)
+            # Serializing and writing the file is not the request's cost
+            job_queue.enqueue(profile.write, self.output_dir)
@@ -0,0 +1,201 @@
+import calendar
+import hashlib
+import logging
+import math
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, Optional
+
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.core.database import SessionLocal
+from app.core.invalidation import invalidation_bus
+from app.models.revokedtoken import RevokedToken
+
+logger = logging.getLogger(__name__)
+
+
+class BloomFilter:
+    """
+    Fixed-size Bloom filter over string keys.
+
+    Sized from the expected number of keys and the acceptable false
+    positive rate; uses double hashing over a single blake2b digest.
+    """
+
+    def __init__(self, capacity: int, error_rate: float):
+        self.size = max(8, math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, key: str):
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self.hash_count):
+            yield (h1 + i * h2) % self.size
+
+    def add(self, key: str) -> None:
+        for pos in self._positions(key):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, key: str) -> bool:
+        return all(self._bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key))
+
+
+class RevocationList:
+    """
+    In-memory view of revoked access token ids (jti).
+
+    is_revoked() never touches the database: a Bloom filter answers the
+    common "not revoked" case and an exact jti -> expiry map settles the
+    filter's false positives. The list is hydrated from revoked_tokens on
+    startup and then refreshed incrementally by a background thread. The
+    refresh polls by created_at and re-reads an overlap window behind the
+    newest row seen, because ids (and timestamps) can commit out of order.
+    Other workers' revocations normally arrive over the invalidation bus;
+    the refresh bounds the delay to refresh_interval seconds if a bus
+    message is lost.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        capacity: int,
+        error_rate: float,
+        refresh_interval: float,
+        overlap: float = 60.0
+    ):
+        self.session_factory = session_factory
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.refresh_interval = refresh_interval
+        self.overlap = timedelta(seconds=overlap)
+
+        self._lock = threading.Lock()
+        self._bloom = BloomFilter(capacity, error_rate)
+        self._exact: Dict[str, float] = {}
+        # Newest created_at seen, in the database's own clock
+        self._last_seen: Optional[datetime] = None
+
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def is_revoked(self, jti: str) -> bool:
+        """
+        Check whether an access token id has been revoked.
+
+        Args:
+            jti: Token id from the JWT
+
+        Returns:
+            True if revoked
+        """
+        if jti not in self._bloom:
+            return False
+        return jti in self._exact
+
+    def add(self, jti: str, expires_at: float) -> None:
+        """
+        Mark a token id revoked in this process.
+
+        Args:
+            jti: Token id
+            expires_at: Token expiry as a UNIX timestamp
+        """
+        with self._lock:
+            self._exact[jti] = expires_at
+            self._bloom.add(jti)
+            if len(self._exact) > self.capacity:
+                self._rebuild()
+
+    def hydrate(self) -> None:
+        """Load every revoked, not yet expired token id from the database."""
+        with self._lock:
+            self._bloom = BloomFilter(self.capacity, self.error_rate)
+            self._exact = {}
+            self._last_seen = None
+        self.refresh(only_unexpired=True)
+        logger.info("Revocation list hydrated with %d tokens", len(self._exact))
+
+    def refresh(self, only_unexpired: bool = False) -> int:
+        """
+        Pull revocations recorded since the last refresh.
+
+        Args:
+            only_unexpired: Skip rows whose token has already expired
+
+        Returns:
+            Number of new revocations loaded
+        """
+        db = self.session_factory()
+        try:
+            query = db.query(RevokedToken.created_at, RevokedToken.jti, RevokedToken.expires_at)
+            if self._last_seen is not None:
+                query = query.filter(RevokedToken.created_at >= self._last_seen - self.overlap)
+            if only_unexpired:
+                query = query.filter(RevokedToken.expires_at > datetime.now(timezone.utc))
+            rows = query.all()
+        finally:
+            db.close()
+
+        loaded = 0
+        for created_at, jti, expires_at in rows:
+            if created_at is not None and (self._last_seen is None or created_at > self._last_seen):
+                self._last_seen = created_at
+            if jti in self._exact:
+                # Re-read from the overlap window
+                continue
+            self.add(jti, calendar.timegm(expires_at.utctimetuple()))
+            loaded += 1
+        return loaded
+
+    def start(self) -> None:
+        """Hydrate and start the background refresh thread."""
+        if self._thread is not None:
+            return
+        self.hydrate()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="revocation-refresh", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.refresh_interval):
+            try:
+                self.refresh()
+            except Exception:
+                logger.exception("Failed to refresh revocation list")
+
+    def _rebuild(self) -> None:
+        # Bloom filters cannot forget, so drop expired ids by starting over.
+        # Caller holds the lock.
+        now = time.time()
+        self._exact = {jti: exp for jti, exp in self._exact.items() if exp > now}
+        self.capacity = max(self.capacity, len(self._exact) * 2)
+        bloom = BloomFilter(self.capacity, self.error_rate)
+        for jti in self._exact:
+            bloom.add(jti)
+        # Swap in a complete filter so readers never see a partial one
+        self._bloom = bloom
+
+
+revocation_list = RevocationList(
+    session_factory=SessionLocal,
+    capacity=settings.REVOCATION_BLOOM_CAPACITY,
+    error_rate=settings.REVOCATION_BLOOM_ERROR_RATE,
+    refresh_interval=settings.REVOCATION_REFRESH_SECONDS
+)
+# Revocations from other workers apply immediately; the periodic refresh is the fallback
+invalidation_bus.subscribe(
+    "token.revoked",
+    lambda event: revocation_list.add(event["key"], event["data"]["exp"])
+)
@@ -0,0 +1,315 @@
+import re
+from typing import Dict, List, Optional, Tuple, Type
+
+from sqlalchemy import func, or_, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.models.oragization import Organization
+from app.models.organizationmember import OrganizationMember
+from app.models.user import User
+
+# Words we search on - punctuation in user input is never passed to the index
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def tokenize_query(query: str) -> List[str]:
+    """
+    Split a raw search string into lowercase search terms.
+
+    Args:
+        query: Text typed by the client
+
+    Returns:
+        List of terms (empty if the query has no searchable characters)
+    """
+    return [token.lower() for token in _TOKEN_RE.findall(query)]
+
+
+def _prefix_match(column, term: str):
+    # lower(col) LIKE 'term%' is what the lower() expression indexes on
+    # users/organizations serve; "_" is both a \w character and a wildcard
+    pattern = term.replace("\\", "\\\\").replace("_", "\\_").replace("%", "\\%")
+    return func.lower(column).like(f"{pattern}%", escape="\\")
+
+
+class SearchBackend:
+    """
+    Interface every search backend implements.
+
+    Backends only deal in ids: they return matching ids in rank order and
+    the total match count, the service layer loads the rows.
+    """
+
+    name = "base"
+
+    def ensure_index(self, engine: Engine) -> None:
+        """Create (and backfill) whatever index structures the backend needs."""
+
+    def index_user(self, db: Session, user: User) -> None:
+        raise NotImplementedError
+
+    def index_organization(self, db: Session, org: Organization) -> None:
+        raise NotImplementedError
+
+    def remove_organization(self, db: Session, org_id: int) -> None:
+        raise NotImplementedError
+
+    def search_users(
+        self,
+        db: Session,
+        terms: List[str],
+        limit: int,
+        offset: int
+    ) -> Tuple[List[int], int]:
+        raise NotImplementedError
+
+    def search_organizations(
+        self,
+        db: Session,
+        terms: List[str],
+        limit: int,
+        offset: int,
+        member_id: Optional[int] = None
+    ) -> Tuple[List[int], int]:
+        raise NotImplementedError
+
+
+class SQLiteFTS5Backend(SearchBackend):
+    """
+    SQLite FTS5 backend.
+
+    Keeps one FTS5 table per entity whose rowid is the entity id, so a
+    match can be joined straight back to the source table. Prefix indexes
+    make "joh" style queries an index lookup instead of a scan.
+    """
+
+    name = "fts5"
+
+    USERS_TABLE = "users_fts"
+    ORGANIZATIONS_TABLE = "organizations_fts"
+
+    def ensure_index(self, engine: Engine) -> None:
+        with engine.begin() as conn:
+            conn.execute(text(
+                f"CREATE VIRTUAL TABLE IF NOT EXISTS {self.USERS_TABLE} USING fts5("
+                "username, full_name, email, "
+                "tokenize='unicode61 remove_diacritics 2', prefix='2 3 4')"
+            ))
+            conn.execute(text(
+                f"CREATE VIRTUAL TABLE IF NOT EXISTS {self.ORGANIZATIONS_TABLE} USING fts5("
+                "name, slug, description, "
+                "tokenize='unicode61 remove_diacritics 2', prefix='2 3 4')"
+            ))
+
+            # Backfill rows that existed before the index did
+            if conn.execute(text(f"SELECT count(*) FROM {self.USERS_TABLE}")).scalar() == 0:
+                conn.execute(text(
+                    f"INSERT INTO {self.USERS_TABLE}(rowid, username, full_name, email) "
+                    "SELECT id, username, coalesce(full_name, ''), email FROM users"
+                ))
+            if conn.execute(text(f"SELECT count(*) FROM {self.ORGANIZATIONS_TABLE}")).scalar() == 0:
+                conn.execute(text(
+                    f"INSERT INTO {self.ORGANIZATIONS_TABLE}(rowid, name, slug, description) "
+                    "SELECT id, name, slug, coalesce(description, '') FROM organizations "
+                    "WHERE is_active = 1"
+                ))
+
+    @staticmethod
+    def _match_expression(terms: List[str]) -> str:
+        # Every term must match, each one as a prefix: "jo sm" -> "jo"* "sm"*
+        return " ".join(f'"{term}"*' for term in terms)
+
+    def index_user(self, db: Session, user: User) -> None:
+        db.execute(
+            text(f"DELETE FROM {self.USERS_TABLE} WHERE rowid = :id"),
+            {"id": user.id}
+        )
+        db.execute(
+            text(
+                f"INSERT INTO {self.USERS_TABLE}(rowid, username, full_name, email) "
+                "VALUES (:id, :username, :full_name, :email)"
+            ),
+            {
+                "id": user.id,
+                "username": user.username,
+                "full_name": user.full_name or "",
+                "email": user.email
+            }
+        )
+
+    def index_organization(self, db: Session, org: Organization) -> None:
+        self.remove_organization(db, org.id)
+        db.execute(
+            text(
+                f"INSERT INTO {self.ORGANIZATIONS_TABLE}(rowid, name, slug, description) "
+                "VALUES (:id, :name, :slug, :description)"
+            ),
+            {
+                "id": org.id,
+                "name": org.name,
+                "slug": org.slug,
+                "description": org.description or ""
+            }
+        )
+
+    def remove_organization(self, db: Session, org_id: int) -> None:
+        db.execute(
+            text(f"DELETE FROM {self.ORGANIZATIONS_TABLE} WHERE rowid = :id"),
+            {"id": org_id}
+        )
+
+    def search_users(self, db, terms, limit, offset):
+        params = {"q": self._match_expression(terms), "limit": limit, "offset": offset}
+        total = db.execute(
+            text(f"SELECT count(*) FROM {self.USERS_TABLE} WHERE {self.USERS_TABLE} MATCH :q"),
+            params
+        ).scalar()
+        if not total:
+            return [], 0
+
+        # Username hits rank above full name hits, which rank above email hits
+        rows = db.execute(
+            text(
+                f"SELECT rowid FROM {self.USERS_TABLE} WHERE {self.USERS_TABLE} MATCH :q "
+                f"ORDER BY bm25({self.USERS_TABLE}, 10.0, 5.0, 1.0) "
+                "LIMIT :limit OFFSET :offset"
+            ),
+            params
+        ).all()
+        return [row[0] for row in rows], total
+
+    def search_organizations(self, db, terms, limit, offset, member_id=None):
+        params = {
+            "q": self._match_expression(terms),
+            "limit": limit,
+            "offset": offset,
+            "member_id": member_id
+        }
+        source = f"{self.ORGANIZATIONS_TABLE} f"
+        if member_id is not None:
+            source += (
+                " JOIN organization_members m"
+                " ON m.organization_id = f.rowid AND m.user_id = :member_id"
+            )
+
+        total = db.execute(
+            text(f"SELECT count(*) FROM {source} WHERE {self.ORGANIZATIONS_TABLE} MATCH :q"),
+            params
+        ).scalar()
+        if not total:
+            return [], 0
+
+        rows = db.execute(
+            text(
+                f"SELECT f.rowid FROM {source} WHERE {self.ORGANIZATIONS_TABLE} MATCH :q "
+                f"ORDER BY bm25({self.ORGANIZATIONS_TABLE}, 10.0, 5.0, 1.0) "
+                "LIMIT :limit OFFSET :offset"
+            ),
+            params
+        ).all()
+        return [row[0] for row in rows], total
+
+
+class PrefixSearchBackend(SearchBackend):
+    """
+    Portable fallback for databases without a registered text index.
+
+    Only anchored prefix matches on lower(column) are issued, backed by
+    the lower() expression indexes declared on User and Organization
+    (text_pattern_ops on Postgres, so LIKE can use them under any
+    collation). Results are ordered by id, not by relevance.
+    """
+
+    name = "prefix"
+
+    def index_user(self, db, user):
+        # Reads go straight to the source tables
+        pass
+
+    def index_organization(self, db, org):
+        pass
+
+    def remove_organization(self, db, org_id):
+        pass
+
+    def search_users(self, db, terms, limit, offset):
+        query = db.query(User.id)
+        for term in terms:
+            query = query.filter(or_(
+                _prefix_match(User.username, term),
+                _prefix_match(User.email, term),
+                _prefix_match(User.full_name, term)
+            ))
+        total = query.count()
+        rows = query.order_by(User.id).limit(limit).offset(offset).all()
+        return [row[0] for row in rows], total
+
+    def search_organizations(self, db, terms, limit, offset, member_id=None):
+        query = db.query(Organization.id).filter(Organization.is_active == True)
+        if member_id is not None:
+            query = query.join(
+                OrganizationMember,
+                Organization.id == OrganizationMember.organization_id
+            ).filter(OrganizationMember.user_id == member_id)
+        for term in terms:
+            query = query.filter(or_(
+                _prefix_match(Organization.name, term),
+                _prefix_match(Organization.slug, term)
+            ))
+        total = query.count()
+        rows = query.order_by(Organization.id).limit(limit).offset(offset).all()
+        return [row[0] for row in rows], total
+
+
+# Backend name -> class. Other backends (e.g. Postgres tsvector) register here.
+_BACKENDS: Dict[str, Type[SearchBackend]] = {
+    SQLiteFTS5Backend.name: SQLiteFTS5Backend,
+    PrefixSearchBackend.name: PrefixSearchBackend,
+}
+
+# Backend picked when SEARCH_BACKEND is "auto"
+_DIALECT_DEFAULTS: Dict[str, str] = {
+    "sqlite": SQLiteFTS5Backend.name,
+}
+
+_instances: Dict[str, SearchBackend] = {}
+
+
+def register_backend(backend_cls: Type[SearchBackend], dialect: Optional[str] = None) -> None:
+    """
+    Make a backend selectable through the SEARCH_BACKEND setting.
+
+    Args:
+        backend_cls: SearchBackend subclass
+        dialect: If given, use this backend by default for that SQL dialect
+    """
+    _BACKENDS[backend_cls.name] = backend_cls
+    if dialect:
+        _DIALECT_DEFAULTS[dialect] = backend_cls.name
+
+
+def get_search_backend(bind: Engine) -> SearchBackend:
+    """
+    Resolve the configured search backend for an engine.
+
+    Args:
+        bind: Engine (or connection) the search will run against
+
+    Returns:
+        Shared backend instance
+
+    Raises:
+        ValueError: If SEARCH_BACKEND names an unknown backend
+    """
+    name = settings.SEARCH_BACKEND
+    if name == "auto":
+        name = _DIALECT_DEFAULTS.get(bind.dialect.name, PrefixSearchBackend.name)
+
+    backend = _instances.get(name)
+    if backend is None:
+        if name not in _BACKENDS:
+            raise ValueError(f"Unknown search backend: {name}")
+        backend = _instances[name] = _BACKENDS[name]()
+    return backend
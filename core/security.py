@@ -1,3 +1,4 @@
+import uuid
 from datetime import datetime, timedelta
 from typing import Optional
 from jose import jwt, JWTError
@@ -6,6 +7,7 @@ from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.orm import Session
 
 from app.config import settings
+from app.core.revocation import revocation_list
 from app.dependencies import get_db
 from app.services.user_service import UserService
 from app.models.user import User
@@ -34,8 +36,9 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     else:
         expire = datetime.utcnow() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)  # ✅ With ()
     
-    # Add expiration to payload
+    # Add expiration and a unique id (used for revocation) to payload
     to_encode.update({"exp": expire})  # ✅ Update after copy
+    to_encode.setdefault("jti", uuid.uuid4().hex)
     
     # Encode and sign
     encoded_jwt = jwt.encode(
@@ -58,21 +61,74 @@ def decode_access_token(token: str) -> dict:  # ✅ Returns dict
         Decoded payload dictionary
         
     Raises:
-        HTTPException: If token is invalid or expired
+        HTTPException: If token is invalid, expired or revoked
     """
+    credentials_exception = HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Could not validate credentials",
+        headers={"WWW-Authenticate": "Bearer"}
+    )
     try:
         payload = jwt.decode(
             token,
             settings.SECRET_KEY,
             algorithms=[settings.ALGORITHM]  # ✅ List
         )
-        return payload
     except JWTError: 
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Could not validate credentials",
-            headers={"WWW-Authenticate": "Bearer"}
+        raise credentials_exception
+    
+    # Refresh tokens are only good for /auth/refresh
+    if payload.get("type") == "refresh":
+        raise credentials_exception
+    
+    # In-memory check - no database round-trip
+    jti = payload.get("jti")
+    if jti and revocation_list.is_revoked(jti):
+        raise credentials_exception
+    
+    return payload
+
+
+def create_refresh_token(user_id: int, jti: str, expires_at: datetime) -> str:
+    """
+    Create a signed refresh token.
+    
+    Args:
+        user_id: User the token belongs to
+        jti: Id of the persisted refresh token row
+        expires_at: Expiry time (UTC)
+        
+    Returns:
+        Encoded JWT string
+    """
+    return jwt.encode(
+        {"sub": str(user_id), "jti": jti, "exp": expires_at, "type": "refresh"},
+        settings.SECRET_KEY,
+        algorithm=settings.ALGORITHM
+    )
+
+
+def decode_refresh_token(token: str) -> Optional[dict]:
+    """
+    Decode and verify a refresh token.
+    
+    Args:
+        token: JWT string
+        
+    Returns:
+        Decoded payload, or None if invalid, expired or not a refresh token
+    """
+    try:
+        payload = jwt.decode(
+            token,
+            settings.SECRET_KEY,
+            algorithms=[settings.ALGORITHM]
         )
+    except JWTError:
+        return None
+    if payload.get("type") != "refresh":
+        return None
+    return payload
 
 
 async def get_current_user(
@@ -114,3 +170,19 @@ async def get_current_user(
     return user
 
 
+async def get_current_superuser(
+    current_user: User = Depends(get_current_user)
+) -> User:
+    """
+    Dependency that only lets superusers through.
+    
+    Raises:
+        HTTPException: If current user is not a superuser
+    """
+    if not current_user.is_superuser:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Superuser privileges required"
+        )
+    
+    return current_user
@@ -0,0 +1,220 @@
+import logging
+import os
+import re
+import sys
+import threading
+import time
+from collections import OrderedDict, deque
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# "METHOD /path" of the request being handled (set by RouteContextMiddleware)
+current_route: ContextVar[Optional[str]] = ContextVar("current_route", default=None)
+
+_SERVICES_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "services")
+
+_EXPLAIN_PREFIX = {
+    "sqlite": "EXPLAIN QUERY PLAN ",
+    "postgresql": "EXPLAIN ",
+    "mysql": "EXPLAIN ",
+}
+
+_STRING_RE = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_RE = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PLACEHOLDER_RE = re.compile(r"%\(\w+\)s|%s|:\w+|\$\d+|\?")
+_IN_LIST_RE = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+
+
+def normalize_sql(statement: str) -> str:
+    """
+    Reduce a statement to its shape so repeats group together.
+
+    Literals and every placeholder style become "?", and IN lists of any
+    length collapse to "(?...)".
+    """
+    sql = " ".join(statement.split())
+    sql = _STRING_RE.sub("?", sql)
+    sql = _PLACEHOLDER_RE.sub("?", sql)
+    sql = _NUMBER_RE.sub("?", sql)
+    return _IN_LIST_RE.sub("(?...)", sql)
+
+
+def parameter_shape(parameters: Any, executemany: bool) -> Any:
+    """Describe bound parameters by type only - values are never logged."""
+    if executemany and isinstance(parameters, (list, tuple)):
+        first = parameter_shape(parameters[0], False) if parameters else None
+        return {"rows": len(parameters), "row": first}
+    if isinstance(parameters, dict):
+        return {key: type(value).__name__ for key, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        return [type(value).__name__ for value in parameters]
+    return type(parameters).__name__
+
+
+def calling_service_method() -> Optional[str]:
+    """
+    Nearest app/services method on the stack, e.g. "UserService.get_user_by_id".
+
+    Nested functions, lambdas and comprehensions ("<locals>", "<dictcomp>",
+    ...) are walked past so the entry names the method that owns them; one
+    is only reported if no enclosing method is found.
+    """
+    frame = sys._getframe(2)
+    nested = None
+    while frame is not None:
+        if frame.f_code.co_filename.startswith(_SERVICES_DIR):
+            qualname = frame.f_code.co_qualname
+            if "<" not in qualname:
+                return qualname
+            nested = nested or qualname
+        frame = frame.f_back
+    return nested
+
+
+class SlowQueryLog:
+    """
+    Records statements slower than a threshold in a bounded ring.
+
+    Each entry carries the normalized SQL, parameter types, the calling
+    service method and the route. The first time a SELECT shape is seen
+    slow, its EXPLAIN plan is captured by a background job on a separate
+    connection - never inside the caller's transaction, where a failing
+    EXPLAIN would abort it on Postgres - and reused for later entries.
+    """
+
+    def __init__(self, threshold_ms: float, size: int, explain: bool, max_plans: int = 500):
+        self.threshold = threshold_ms / 1000
+        self.explain = explain
+        self.max_plans = max_plans
+        self._entries: deque = deque(maxlen=size)
+        self._plans: "OrderedDict[str, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def install(self, engine: Engine) -> None:
+        """Attach the timing hooks to an engine."""
+        event.listen(engine, "before_cursor_execute", self._before)
+        event.listen(engine, "after_cursor_execute", self._after)
+        event.listen(engine, "handle_error", self._error)
+
+    def entries(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Recorded slow statements, newest first, with their plans."""
+        with self._lock:
+            entries = list(reversed(self._entries))
+            plans = dict(self._plans)
+        if limit is not None:
+            entries = entries[:limit]
+        return [dict(entry, plan=plans.get(entry["sql"])) for entry in entries]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._plans.clear()
+
+    def _before(self, conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("slow_query_start", []).append(time.perf_counter())
+
+    def _error(self, context):
+        # A failed statement never reaches _after; drop its start time
+        conn = context.connection
+        if conn is not None and context.statement is not None and conn.info.get("slow_query_start"):
+            conn.info["slow_query_start"].pop()
+
+    def _after(self, conn, cursor, statement, parameters, context, executemany):
+        starts = conn.info.get("slow_query_start")
+        if not starts:
+            return
+        duration = time.perf_counter() - starts.pop()
+        if duration < self.threshold:
+            return
+
+        sql = normalize_sql(statement)
+        entry = {
+            "sql": sql,
+            "duration_ms": round(duration * 1000, 3),
+            "parameters": parameter_shape(parameters, executemany),
+            "service": calling_service_method(),
+            "route": current_route.get(),
+            "at": datetime.now(timezone.utc).isoformat(),
+        }
+        with self._lock:
+            self._entries.append(entry)
+            need_plan = (
+                self.explain
+                and not executemany
+                and sql not in self._plans
+                and sql.upper().startswith(("SELECT", "WITH"))
+            )
+            if need_plan:
+                # Placeholder so the plan is only captured once
+                self._store_plan(sql, None)
+        logger.warning(
+            "Slow query (%.1f ms) in %s [%s]: %s",
+            entry["duration_ms"], entry["service"], entry["route"], sql
+        )
+
+        if need_plan:
+            # Imported here: core.jobs is not needed unless a plan is captured
+            from app.core.jobs import job_queue
+            job_queue.enqueue(self._capture_plan, conn.engine, sql, statement, parameters)
+
+    def _store_plan(self, sql: str, plan: Any) -> None:
+        # Caller holds self._lock
+        self._plans[sql] = plan
+        while len(self._plans) > self.max_plans:
+            self._plans.popitem(last=False)
+
+    def _capture_plan(self, engine: Engine, sql: str, statement: str, parameters: Any) -> None:
+        plan = self._explain(engine, statement, parameters)
+        with self._lock:
+            if sql in self._plans:
+                self._store_plan(sql, plan)
+
+    @staticmethod
+    def _explain(engine: Engine, statement: str, parameters: Any) -> Any:
+        prefix = _EXPLAIN_PREFIX.get(engine.dialect.name)
+        if prefix is None:
+            return None
+        # Own pooled connection, rolled back on close; a raw DBAPI cursor
+        # does not re-enter these event hooks
+        try:
+            with engine.connect() as conn:
+                cursor = conn.connection.cursor()
+                try:
+                    cursor.execute(prefix + statement, parameters)
+                    return [list(row) for row in cursor.fetchall()]
+                finally:
+                    cursor.close()
+        except Exception as e:
+            return f"EXPLAIN failed: {e}"
+
+
+class RouteContextMiddleware:
+    """ASGI middleware exposing "METHOD /path" to the slow query log."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        token = current_route.set(f"{scope['method']} {scope['path']}")
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            current_route.reset(token)
+
+
+slow_query_log = SlowQueryLog(
+    threshold_ms=settings.SLOW_QUERY_THRESHOLD_MS,
+    size=settings.SLOW_QUERY_LOG_SIZE,
+    explain=settings.SLOW_QUERY_EXPLAIN
+)
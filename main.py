@@ -2,6 +2,15 @@ from fastapi import FastAPI
 from app.core.database import engine 
 from app.config import settings
 from app.api.v1.router import api_router
+from app.core.audit import audit_log
+from app.core.change_feed import change_feed
+from app.core.concurrency import ConcurrencyLimitMiddleware, configure_thread_pool, route_limiters
+from app.core.invalidation import invalidation_bus
+from app.core.jobs import job_queue
+from app.core.profiling import ProfilingMiddleware, install_sql_hooks, install_thread_hooks
+from app.core.slow_query import RouteContextMiddleware, slow_query_log
+from app.core.revocation import revocation_list
+from app.core.search import get_search_backend
 
 app = FastAPI(
     title=settings.APP_NAME,
@@ -10,6 +19,76 @@ app = FastAPI(
 )
 app.include_router(api_router,prefix="/api/v1")
 
+if settings.SLOW_QUERY_ENABLED:
+    slow_query_log.install(engine)
+    app.add_middleware(RouteContextMiddleware)
+
+if settings.PROFILING_ENABLED:
+    install_sql_hooks(engine)
+    install_thread_hooks()
+    app.add_middleware(
+        ProfilingMiddleware,
+        sample_rate=settings.PROFILING_SAMPLE_RATE,
+        interval=settings.PROFILING_INTERVAL_MS / 1000,
+        output_dir=settings.PROFILING_OUTPUT_DIR
+    )
+
+if settings.CONCURRENCY_LIMIT_ENABLED:
+    app.add_middleware(
+        ConcurrencyLimitMiddleware,
+        limiters=route_limiters,
+        queue_timeout=settings.CONCURRENCY_QUEUE_TIMEOUT_SECONDS
+    )
+
+@app.on_event("startup")
+async def size_thread_pool():
+    """Match the sync endpoint thread pool to the DB connection pool"""
+    configure_thread_pool()
+
+@app.on_event("startup")
+def create_search_index():
+    """Make sure the full-text index exists before serving searches"""
+    get_search_backend(engine).ensure_index(engine)
+
+@app.on_event("startup")
+async def start_job_queue():
+    await job_queue.start()
+
+@app.on_event("shutdown")
+async def drain_job_queue():
+    """Finish queued side effects before the worker exits"""
+    await job_queue.stop(timeout=settings.JOB_DRAIN_TIMEOUT_SECONDS)
+
+@app.on_event("startup")
+def start_audit_log():
+    audit_log.start()
+
+@app.on_event("shutdown")
+def flush_audit_log():
+    """Write out buffered audit events before the worker exits"""
+    audit_log.stop()
+
+@app.on_event("startup")
+def start_invalidation_bus():
+    invalidation_bus.start()
+
+@app.on_event("shutdown")
+def stop_invalidation_bus():
+    invalidation_bus.stop()
+
+@app.on_event("startup")
+async def start_change_feed():
+    change_feed.start()
+
+@app.on_event("startup")
+def load_revocation_list():
+    """Hydrate revoked token ids before the first authenticated request"""
+    revocation_list.start()
+
+@app.on_event("shutdown")
+def stop_revocation_list():
+    revocation_list.stop()
+
 @app.get("/")
 def root():
     """Root endpoint"""
@@ -0,0 +1,18 @@
+from sqlalchemy import Column, Integer, String, DateTime, JSON, Index
+from app.models.base import BaseModel
+
+class AuditLog(BaseModel):
+    """Append-only record of organization and membership changes"""
+    __tablename__ = "audit_logs"
+    
+    action = Column(String(50), nullable=False, index=True)
+    organization_id = Column(Integer, nullable=True)
+    actor_id = Column(Integer, nullable=True, index=True)
+    target_user_id = Column(Integer, nullable=True)
+    details = Column(JSON, nullable=True)
+    # When the change happened (rows are written later, in batches)
+    occurred_at = Column(DateTime(timezone=True), nullable=False)
+    
+    __table_args__ = (
+        Index('ix_audit_logs_org_occurred', 'organization_id', 'occurred_at'),
+    )
@@ -1,9 +1,18 @@
+from datetime import datetime, timezone
 from app.core.database import Base
 from sqlalchemy import Column,Integer,DateTime
 from sqlalchemy.sql import func
+
+
+def _utcnow() -> datetime:
+    # Set app-side: SQLite's now() has one second resolution, and ETags are
+    # built from updated_at, so two writes in one second must still differ
+    return datetime.now(timezone.utc)
+
+
 class BaseModel(Base):
     __abstract__ = True
     id = Column(Integer,primary_key=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    updated_at = Column(DateTime(timezone=True), onupdate=_utcnow)
     
@@ -0,0 +1,16 @@
+from sqlalchemy import Column, Integer, DateTime, Index
+from sqlalchemy.sql import func
+from app.models.base import BaseModel
+
+class MembershipTombstone(BaseModel):
+    """Marks a removed membership so delta-sync clients can drop it"""
+    __tablename__ = "membership_tombstones"
+    
+    organization_id = Column(Integer, nullable=False)
+    user_id = Column(Integer, nullable=False)
+    removed_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    
+    __table_args__ = (
+        Index('ix_membership_tombstones_org_removed', 'organization_id', 'removed_at'),
+        Index('ix_membership_tombstones_user_removed', 'user_id', 'removed_at'),
+    )
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Boolean, JSON
+from sqlalchemy import Column, String, Boolean, JSON, DateTime, Index, func
 from sqlalchemy.orm import relationship
 from app.models.base import BaseModel
 
@@ -12,10 +12,25 @@ class Organization(BaseModel):
     plan = Column(String(20), default="free", nullable=False)
     settings = Column(JSON, nullable=True, default=dict)
     is_active = Column(Boolean, default=True, nullable=False)
+    # Bumped on every membership change; lets "members since" skip unchanged orgs
+    members_changed_at = Column(DateTime(timezone=True), nullable=True)
     
     # Relationships
     members = relationship(
         "OrganizationMember",
         back_populates="organization",
         cascade="all, delete-orphan"
+    )
+    
+    __table_args__ = (
+        Index('ix_organizations_updated_at', 'updated_at'),
+    )
+
+
+# Case-insensitive prefix search (PrefixSearchBackend): lower(col) LIKE 'x%'
+for _column in ("name", "slug"):
+    Index(
+        f"ix_organizations_{_column}_lower",
+        func.lower(getattr(Organization, _column)).label(f"{_column}_lower"),
+        postgresql_ops={f"{_column}_lower": "text_pattern_ops"}
     )
\ No newline at end of file
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, UniqueConstraint
+from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, UniqueConstraint, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from app.models.base import BaseModel
@@ -21,4 +21,7 @@ class OrganizationMember(BaseModel):
     # Constraints
     __table_args__ = (
         UniqueConstraint('user_id', 'organization_id', name='unique_user_org'),
+        # Delta sync: "members of org X changed since T"
+        Index('ix_organization_members_org_joined', 'organization_id', 'joined_at'),
+        Index('ix_organization_members_org_updated', 'organization_id', 'updated_at'),
     )
\ No newline at end of file
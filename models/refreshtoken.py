@@ -0,0 +1,12 @@
+from sqlalchemy import Column, Integer, String, ForeignKey, DateTime
+from app.models.base import BaseModel
+
+class RefreshToken(BaseModel):
+    """Issued refresh token; rotated on every use"""
+    __tablename__ = "refresh_tokens"
+    
+    jti = Column(String(64), unique=True, nullable=False, index=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    expires_at = Column(DateTime(timezone=True), nullable=False)
+    revoked_at = Column(DateTime(timezone=True), nullable=True)
+    replaced_by = Column(String(64), nullable=True)  # jti of the token it was rotated into
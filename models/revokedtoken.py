@@ -0,0 +1,14 @@
+from sqlalchemy import Column, String, DateTime, Index
+from app.models.base import BaseModel
+
+class RevokedToken(BaseModel):
+    """Access token revoked before its expiry (kept until it would have expired)"""
+    __tablename__ = "revoked_tokens"
+    
+    jti = Column(String(64), unique=True, nullable=False, index=True)
+    expires_at = Column(DateTime(timezone=True), nullable=False, index=True)
+    
+    __table_args__ = (
+        # RevocationList polls by created_at
+        Index('ix_revoked_tokens_created_at', 'created_at'),
+    )
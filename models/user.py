@@ -1,5 +1,5 @@
 from app.models.base import BaseModel
-from sqlalchemy import Column,Integer,String,Boolean
+from sqlalchemy import Column,Integer,String,Boolean,Index,func
 from sqlalchemy.orm import relationship
 class User(BaseModel):
     __tablename__ = "users"
@@ -10,5 +10,14 @@ class User(BaseModel):
     is_active = Column(Boolean , default = True)
     is_superuser = Column(Boolean , default = False)
 
-    organization_memberships = relationship("OrganzationMembers",foreign_keys="OrganizationMember.user_id", back_populates="user", cascade="all, delete-orphan")
+    organization_memberships = relationship("OrganizationMember",foreign_keys="OrganizationMember.user_id", back_populates="user", cascade="all, delete-orphan")
+
+
+# Case-insensitive prefix search (PrefixSearchBackend): lower(col) LIKE 'x%'
+for _column in ("username", "email", "full_name"):
+    Index(
+        f"ix_users_{_column}_lower",
+        func.lower(getattr(User, _column)).label(f"{_column}_lower"),
+        postgresql_ops={f"{_column}_lower": "text_pattern_ops"}
+    )
 
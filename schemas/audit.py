@@ -0,0 +1,15 @@
+from pydantic import BaseModel
+from typing import Optional
+from datetime import datetime
+
+class AuditLogResponse(BaseModel):
+    id: int
+    action: str
+    organization_id: Optional[int] = None
+    actor_id: Optional[int] = None
+    target_user_id: Optional[int] = None
+    details: Optional[dict] = None
+    occurred_at: datetime
+
+    class Config:
+        from_attributes = True
@@ -0,0 +1,21 @@
+from pydantic import BaseModel, Field
+from typing import Any, Dict, List, Union
+from app.schemas.organizations import MemberResponse, OrganizationResponse
+
+
+class OrganizationChanges(BaseModel):
+    """
+    Delta for GET /organizations?since=<cursor>.
+    """
+    upserted: List[Union[OrganizationResponse, Dict[str, Any]]] = Field(default_factory=list)
+    removed: List[int] = Field(default_factory=list, description="Organization IDs to drop")
+    cursor: str = Field(..., description="Pass as since= on the next sync")
+
+
+class MemberChanges(BaseModel):
+    """
+    Delta for GET /organizations/{slug}/members?since=<cursor>.
+    """
+    upserted: List[Union[MemberResponse, Dict[str, Any]]] = Field(default_factory=list)
+    removed: List[int] = Field(default_factory=list, description="User IDs to drop")
+    cursor: str = Field(..., description="Pass as since= on the next sync")
@@ -61,5 +61,17 @@ class UserLogin(BaseModel):
 
 class LoginResponse(BaseModel):
     access_token: str
+    refresh_token: Optional[str] = None
     token_type: str = "bearer"
-    user: UserResponse
\ No newline at end of file
+    user: UserResponse
+
+
+class RefreshRequest(BaseModel):
+    """Schema for exchanging / revoking a refresh token"""
+    refresh_token: str
+
+
+class TokenResponse(BaseModel):
+    access_token: str
+    refresh_token: str
+    token_type: str = "bearer"
\ No newline at end of file
@@ -0,0 +1,46 @@
+from typing import List, Optional, Tuple
+from sqlalchemy.orm import Session
+from app.models.auditlog import AuditLog
+
+
+class AuditService:
+    """Read access to the audit trail"""
+
+    @staticmethod
+    def list_events(
+        db: Session,
+        page: int,
+        size: int,
+        organization_id: Optional[int] = None,
+        actor_id: Optional[int] = None,
+        action: Optional[str] = None
+    ) -> Tuple[List[AuditLog], int]:
+        """
+        Get audit events, newest first.
+
+        Args:
+            db: Database session
+            page: 1-based page number
+            size: Page size
+            organization_id: Only events for this organization
+            actor_id: Only events made by this user
+            action: Only events of this action
+
+        Returns:
+            Tuple of (events for this page, total matching events)
+        """
+        query = db.query(AuditLog)
+        if organization_id is not None:
+            query = query.filter(AuditLog.organization_id == organization_id)
+        if actor_id is not None:
+            query = query.filter(AuditLog.actor_id == actor_id)
+        if action is not None:
+            query = query.filter(AuditLog.action == action)
+
+        total = query.count()
+        events = query.order_by(
+            AuditLog.occurred_at.desc(),
+            AuditLog.id.desc()
+        ).limit(size).offset((page - 1) * size).all()
+
+        return events, total
@@ -0,0 +1,51 @@
+"""
+Background job bodies.
+
+Each job opens its own session: the request session is closed by the
+time a worker picks the job up.
+"""
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+from app.config import settings
+from app.core.database import SessionLocal
+from app.models.membershiptombstone import MembershipTombstone
+from app.models.user import User
+from app.services.notification_service import NotificationService
+
+
+def notify_member_added(org_id: int, user_id: int, role: str, invited_by_id: Optional[int]) -> None:
+    NotificationService.member_added(org_id, user_id, role, invited_by_id)
+
+
+def cleanup_removed_member(org_id: int, user_id: int) -> None:
+    NotificationService.member_removed(org_id, user_id)
+    prune_membership_tombstones(org_id)
+
+
+def prune_membership_tombstones(org_id: int) -> None:
+    """Drop tombstones older than any cursor the sync API still accepts."""
+    cutoff = datetime.now(timezone.utc) - timedelta(days=settings.SYNC_TOMBSTONE_RETENTION_DAYS)
+    db = SessionLocal()
+    try:
+        db.query(MembershipTombstone).filter(
+            MembershipTombstone.organization_id == org_id,
+            MembershipTombstone.removed_at < cutoff
+        ).delete(synchronize_session=False)
+        db.commit()
+    finally:
+        db.close()
+
+
+def rehash_password(user_id: int, password: str) -> None:
+    """Upgrade a stored hash that uses outdated scheme/parameters."""
+    from app.services.user_service import pwd_context
+
+    db = SessionLocal()
+    try:
+        user = db.query(User).filter(User.id == user_id).first()
+        if not user or not pwd_context.needs_update(user.hashed_password):
+            return
+        user.hashed_password = pwd_context.hash(password)
+        db.commit()
+    finally:
+        db.close()
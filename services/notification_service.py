@@ -0,0 +1,45 @@
+import logging
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+class NotificationService:
+    """
+    Delivers user-facing notifications.
+
+    There is no mail/push provider wired up yet, so notifications are
+    written to the log. Called from background jobs, never inline.
+    """
+
+    @staticmethod
+    def member_added(
+        org_id: int,
+        user_id: int,
+        role: str,
+        invited_by_id: Optional[int]
+    ) -> None:
+        """
+        Tell a user they were added to an organization.
+
+        Args:
+            org_id: Organization ID
+            user_id: User who was added
+            role: Role they were given
+            invited_by_id: User ID of inviter
+        """
+        logger.info(
+            "Notify user %s: added to organization %s as %s by %s",
+            user_id, org_id, role, invited_by_id
+        )
+
+    @staticmethod
+    def member_removed(org_id: int, user_id: int) -> None:
+        """
+        Tell a user they were removed from an organization.
+
+        Args:
+            org_id: Organization ID
+            user_id: User who was removed
+        """
+        logger.info("Notify user %s: removed from organization %s", user_id, org_id)
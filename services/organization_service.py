@@ -1,12 +1,53 @@
 import re
+from datetime import datetime
 from typing import List, Optional, Tuple
+from sqlalchemy import func, update
 from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm.attributes import set_committed_value
+from app.config import settings
+from app.core.audit import audit_log
+from app.core.cache import MISSING, LocalCache
+from app.core.invalidation import invalidation_bus
+from app.core.jobs import job_queue
+from app.models.membershiptombstone import MembershipTombstone
 from app.models.oragization import Organization
 from app.models.organizationmember import OrganizationMember
 from app.models.user import User
 from app.schemas.organizations import OrganizationCreate, OrganizationUpdate
-from app.utils import slugify
+from app.services.jobs import cleanup_removed_member, notify_member_added
+from app.services.search_service import SearchService
+from app.services.user_service import UserService
+from app.utils.slugify import generate_slug
 
+# Per-worker caches, kept coherent across workers by the invalidation bus
+_org_versions = LocalCache("org_versions", settings.CACHE_MAX_ENTRIES, settings.CACHE_TTL_SECONDS)
+invalidation_bus.subscribe("organization", _org_versions.on_invalidate)
+
+
+def _membership_key(org_id: int, user_id: int) -> str:
+    return f"{org_id}:{user_id}"
+
+
+def _publish_membership_change(event_type: str, org_id: int, user_id: int, role: Optional[str]) -> None:
+    # Feeds the membership change stream on every worker
+    invalidation_bus.publish(
+        "membership",
+        _membership_key(org_id, user_id),
+        {"type": event_type, "organization_id": org_id, "user_id": user_id, "role": role}
+    )
+
+
+def _touch_members(db: Session, org_id: int) -> None:
+    # Bump the delta-sync watermark without touching updated_at, which
+    # drives the organization's own ETag and "since" listing
+    db.execute(
+        update(Organization).where(
+            Organization.id == org_id
+        ).values(
+            members_changed_at=func.now(),
+            updated_at=Organization.updated_at
+        ).execution_options(synchronize_session=False)
+    )
 
 
 class OrganizationService:
@@ -33,13 +74,14 @@ class OrganizationService:
             ValueError: If organization creation fails
         """
         # Generate unique slug
-        slug = slugify(org_data.name, db)
+        slug = generate_slug(org_data.name, db)
         
         # Create organization
         org = Organization(
             name=org_data.name,
             slug=slug,
-            description=org_data.description
+            description=org_data.description,
+            members_changed_at=func.now()
         )
         
         db.add(org)
@@ -54,9 +96,13 @@ class OrganizationService:
         )
         
         db.add(member)
+        SearchService.index_organization(db, org)
         db.commit()
         db.refresh(org)
         
+        invalidation_bus.publish("organization", org.slug)
+        _publish_membership_change("member.added", org.id, owner_id, "owner")
+        
         return org
     
     @staticmethod
@@ -107,6 +153,39 @@ class OrganizationService:
             Organization.is_active == True
         ).first()
     
+    @staticmethod
+    def get_organization_version_by_slug(
+        db: Session,
+        slug: str
+    ) -> Optional[Tuple[int, datetime, Optional[datetime]]]:
+        """
+        Get only the id and timestamps of an active organization.
+        
+        Used to answer conditional GETs without loading the full row.
+        
+        Args:
+            db: Database session
+            slug: Organization slug
+            
+        Returns:
+            Tuple of (id, created_at, updated_at) or None if not found
+        """
+        version = _org_versions.get(slug)
+        if version is MISSING:
+            generation = _org_versions.generation()
+            row = db.query(
+                Organization.id,
+                Organization.created_at,
+                Organization.updated_at
+            ).filter(
+                Organization.slug == slug,
+                Organization.is_active == True
+            ).first()
+            version = tuple(row) if row else None
+            _org_versions.set(slug, version, generation)
+        
+        return version
+    
     @staticmethod
     def get_user_role_in_org(
         db: Session,
@@ -124,7 +203,9 @@ class OrganizationService:
         Returns:
             Role string or None if not a member
         """
-        membership = db.query(OrganizationMember).filter(
+        # Authorization check: always read from the database, never from a
+        # cache a lost or late invalidation could leave stale
+        membership = db.query(OrganizationMember.role).filter(
             OrganizationMember.user_id == user_id,
             OrganizationMember.organization_id == org_id
         ).first()
@@ -135,7 +216,8 @@ class OrganizationService:
     def update_organization(
         db: Session,
         org_id: int,
-        updates: OrganizationUpdate
+        updates: OrganizationUpdate,
+        actor_id: Optional[int] = None
     ) -> Organization:
         """
         Update organization fields.
@@ -144,6 +226,7 @@ class OrganizationService:
             db: Database session
             org_id: Organization ID
             updates: Fields to update
+            actor_id: User ID making the change (for the audit log)
             
         Returns:
             Updated organization
@@ -166,16 +249,28 @@ class OrganizationService:
         for key, value in update_data.items():
             setattr(org, key, value)
         
+        if update_data:
+            SearchService.index_organization(db, org)
+        
         # Save changes
         db.commit()
         db.refresh(org)
         
+        invalidation_bus.publish("organization", org.slug)
+        audit_log.record(
+            "organization.updated",
+            organization_id=org_id,
+            actor_id=actor_id,
+            details={"fields": sorted(update_data)}
+        )
+        
         return org
     
     @staticmethod
     def delete_organization(
         db: Session,
-        org_id: int
+        org_id: int,
+        actor_id: Optional[int] = None
     ) -> bool:
         """
         Delete organization (soft delete - set is_active=False).
@@ -183,6 +278,7 @@ class OrganizationService:
         Args:
             db: Database session
             org_id: Organization ID
+            actor_id: User ID making the change (for the audit log)
             
         Returns:
             True if deleted
@@ -199,8 +295,12 @@ class OrganizationService:
         
         # Soft delete
         org.is_active = False
+        SearchService.remove_organization(db, org.id)
         db.commit()
         
+        invalidation_bus.publish("organization", org.slug)
+        audit_log.record("organization.deleted", organization_id=org_id, actor_id=actor_id)
+        
         return True
     
     @staticmethod
@@ -255,16 +355,28 @@ class OrganizationService:
         )
         
         db.add(member)
+        _touch_members(db, org_id)
         db.commit()
         db.refresh(member)
         
+        _publish_membership_change("member.added", org_id, user.id, role)
+        audit_log.record(
+            "member.added",
+            organization_id=org_id,
+            actor_id=invited_by_id,
+            target_user_id=user.id,
+            details={"role": role}
+        )
+        job_queue.enqueue(notify_member_added, org_id, user.id, role, invited_by_id)
+        
         return member
     
     @staticmethod
     def remove_member(
         db: Session,
         org_id: int,
-        user_id: int
+        user_id: int,
+        actor_id: Optional[int] = None
     ) -> bool:
         """
         Remove a member from organization.
@@ -273,6 +385,7 @@ class OrganizationService:
             db: Database session
             org_id: Organization ID
             user_id: User ID to remove
+            actor_id: User ID making the change (for the audit log)
             
         Returns:
             True if removed
@@ -294,9 +407,22 @@ class OrganizationService:
             raise ValueError("Cannot remove organization owner. Transfer ownership first.")
         
         # Delete membership
+        role = membership.role
         db.delete(membership)
+        db.add(MembershipTombstone(organization_id=org_id, user_id=user_id))
+        _touch_members(db, org_id)
         db.commit()
         
+        _publish_membership_change("member.removed", org_id, user_id, None)
+        audit_log.record(
+            "member.removed",
+            organization_id=org_id,
+            actor_id=actor_id,
+            target_user_id=user_id,
+            details={"role": role}
+        )
+        job_queue.enqueue(cleanup_removed_member, org_id, user_id)
+        
         return True
     
     @staticmethod
@@ -304,7 +430,8 @@ class OrganizationService:
         db: Session,
         org_id: int,
         user_id: int,
-        new_role: str
+        new_role: str,
+        actor_id: Optional[int] = None
     ) -> OrganizationMember:
         """
         Update member's role in organization.
@@ -314,6 +441,7 @@ class OrganizationService:
             org_id: Organization ID
             user_id: User ID
             new_role: New role for user
+            actor_id: User ID making the change (for the audit log)
             
         Returns:
             Updated membership
@@ -336,10 +464,21 @@ class OrganizationService:
             raise ValueError("User is not a member of this organization")
         
         # Update role
+        old_role = membership.role
         membership.role = new_role
+        _touch_members(db, org_id)
         db.commit()
         db.refresh(membership)
         
+        _publish_membership_change("member.role_updated", org_id, user_id, new_role)
+        audit_log.record(
+            "member.role_updated",
+            organization_id=org_id,
+            actor_id=actor_id,
+            target_user_id=user_id,
+            details={"from": old_role, "to": new_role}
+        )
+        
         return membership
     
     @staticmethod
@@ -350,6 +489,10 @@ class OrganizationService:
         """
         Get all members of an organization.
         
+        Inviters are resolved through the request's user loader and set on
+        member.invited_by, so reading it costs one batched query for all
+        members instead of a lazy load per member.
+        
         Args:
             db: Database session
             org_id: Organization ID
@@ -366,6 +509,18 @@ class OrganizationService:
             OrganizationMember.joined_at.desc()
         ).all()
         
+        # Most inviters are members themselves and need no query at all
+        loader = UserService.user_loader(db)
+        for user, _ in results:
+            loader.prime(user.id, user)
+        inviters = [
+            (member, UserService.load_user(db, member.invited_by_id))
+            for _, member in results
+            if member.invited_by_id is not None
+        ]
+        for member, inviter in inviters:
+            set_committed_value(member, "invited_by", inviter.result())
+        
         return results
     
     @staticmethod
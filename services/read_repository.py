@@ -0,0 +1,231 @@
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Type
+from pydantic import BaseModel as Schema
+from sqlalchemy import func, or_, select
+from sqlalchemy.orm import Session, aliased
+from app.models.oragization import Organization
+from app.models.organizationmember import OrganizationMember
+from app.models.user import User
+from app.schemas.organizations import MemberResponse, OrganizationResponse
+from app.schemas.user import UserResponse
+
+
+class Row:
+    """
+    Base for the plain, slotted objects the read repository returns.
+
+    No identity map, no change tracking, no per-instance __dict__ - just
+    the selected columns as attributes, which is all from_attributes
+    response schemas need.
+    """
+    __slots__ = ()
+
+    def __init__(self, *values):
+        for name, value in zip(self.__slots__, values):
+            setattr(self, name, value)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.as_dict()!r})"
+
+
+_row_classes: Dict[Tuple[str, Tuple[str, ...]], Type[Row]] = {}
+
+
+def row_class(name: str, fields: Sequence[str]) -> Type[Row]:
+    """Slotted Row subclass for a field list (cached per name/fields)."""
+    key = (name, tuple(fields))
+    cls = _row_classes.get(key)
+    if cls is None:
+        cls = _row_classes[key] = type(name, (Row,), {"__slots__": tuple(fields)})
+    return cls
+
+
+def parse_fields(fields: Optional[str], schema: Type[Schema]) -> Optional[List[str]]:
+    """
+    Parse a ?fields=a,b,c sparse fieldset against a response schema.
+
+    Args:
+        fields: Raw query parameter (None, empty or only commas means "all fields")
+        schema: Response schema the fields must belong to
+
+    Returns:
+        Requested field names in order, or None for the full schema
+
+    Raises:
+        ValueError: If a field is not part of the schema
+    """
+    if not fields:
+        return None
+    requested = list(dict.fromkeys(part.strip() for part in fields.split(",") if part.strip()))
+    if not requested:
+        # e.g. "?fields=," - nothing to project on, same as not asking
+        return None
+    unknown = [name for name in requested if name not in schema.model_fields]
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+    return requested
+
+
+def _projection(
+    schema: Type[Schema],
+    columns: Dict[str, Any],
+    fields: Optional[Iterable[str]],
+    optional: Iterable[str] = ()
+) -> List[str]:
+    # Default projection: every schema field backed by a column, minus the
+    # ones that cost extra work and must be asked for explicitly
+    if fields is None:
+        skip = set(optional)
+        return [name for name in schema.model_fields if name in columns and name not in skip]
+    return [name for name in fields if name in columns]
+
+
+class ReadRepository:
+    """
+    Read-side queries issued as Core select()s.
+
+    Only the columns the response needs are selected, and rows come back
+    as slotted Row objects rather than ORM entities, so large listings do
+    not fill the session's identity map. Use the ORM services for anything
+    that is going to be modified.
+    """
+
+    @staticmethod
+    def get_user(
+        db: Session,
+        user_id: int,
+        fields: Optional[List[str]] = None
+    ) -> Optional[Row]:
+        """
+        Get one user projected onto UserResponse (or a sparse subset).
+
+        Args:
+            db: Database session
+            user_id: User ID
+            fields: Sparse fieldset (None for the full UserResponse)
+
+        Returns:
+            Row or None if not found
+        """
+        columns = {name: getattr(User, name) for name in UserResponse.model_fields}
+        names = _projection(UserResponse, columns, fields)
+        stmt = select(*(columns[name] for name in names)).where(User.id == user_id)
+
+        row = db.execute(stmt).first()
+        return row_class("UserRow", names)(*row) if row else None
+
+    @staticmethod
+    def get_organization_members(
+        db: Session,
+        org_id: int,
+        fields: Optional[List[str]] = None,
+        since: Optional[datetime] = None
+    ) -> List[Row]:
+        """
+        Get all members of an organization projected onto MemberResponse.
+
+        The inviter join only happens when invited_by is selected.
+
+        Args:
+            db: Database session
+            org_id: Organization ID
+            fields: Sparse fieldset (None for the full MemberResponse)
+            since: Only memberships added or changed after this time
+
+        Returns:
+            Rows ordered by joined_at, newest first
+        """
+        inviter = aliased(User)
+        columns = {
+            "user_id": OrganizationMember.user_id,
+            "username": User.username,
+            "email": User.email,
+            "role": OrganizationMember.role,
+            "joined_at": OrganizationMember.joined_at,
+            "invited_by": inviter.username,
+        }
+        names = _projection(MemberResponse, columns, fields)
+
+        stmt = select(*(columns[name] for name in names)).select_from(OrganizationMember)
+        if any(name in ("username", "email") for name in names):
+            stmt = stmt.join(User, User.id == OrganizationMember.user_id)
+        if "invited_by" in names:
+            stmt = stmt.outerjoin(inviter, inviter.id == OrganizationMember.invited_by_id)
+        stmt = stmt.where(OrganizationMember.organization_id == org_id)
+        if since is not None:
+            # The membership row, or a user whose name/email is shown
+            changed = [
+                OrganizationMember.joined_at > since,
+                OrganizationMember.updated_at > since,
+            ]
+            if any(name in ("username", "email") for name in names):
+                changed.append(User.updated_at > since)
+            if "invited_by" in names:
+                changed.append(inviter.updated_at > since)
+            stmt = stmt.where(or_(*changed))
+        stmt = stmt.order_by(
+            OrganizationMember.joined_at.desc()
+        )
+
+        cls = row_class("MemberRow", names)
+        return [cls(*row) for row in db.execute(stmt)]
+
+    @staticmethod
+    def get_user_organizations(
+        db: Session,
+        user_id: int,
+        fields: Optional[List[str]] = None,
+        since: Optional[datetime] = None
+    ) -> List[Row]:
+        """
+        Get the active organizations a user belongs to, projected onto
+        OrganizationResponse with current_user_role filled in.
+
+        member_count is a per-row count, so it is only computed when
+        requested through fields.
+
+        Args:
+            db: Database session
+            user_id: User ID
+            fields: Sparse fieldset (None for OrganizationResponse minus member_count)
+            since: Only organizations (or the user's membership in them)
+                changed after this time
+
+        Returns:
+            Rows ordered by organization name
+        """
+        member_count = select(
+            func.count(OrganizationMember.id)
+        ).where(
+            OrganizationMember.organization_id == Organization.id
+        ).correlate(Organization).scalar_subquery()
+
+        columns = {name: getattr(Organization, name) for name in OrganizationResponse.model_fields if hasattr(Organization, name)}
+        columns["current_user_role"] = OrganizationMember.role
+        columns["member_count"] = member_count
+        names = _projection(OrganizationResponse, columns, fields, optional=("member_count",))
+
+        stmt = select(*(columns[name] for name in names)).select_from(Organization).join(
+            OrganizationMember,
+            Organization.id == OrganizationMember.organization_id
+        ).where(
+            OrganizationMember.user_id == user_id,
+            Organization.is_active == True
+        )
+        if since is not None:
+            changed = [
+                Organization.created_at > since,
+                Organization.updated_at > since,
+                OrganizationMember.joined_at > since,
+                OrganizationMember.updated_at > since,
+            ]
+            if "member_count" in names:
+                changed.append(Organization.members_changed_at > since)
+            stmt = stmt.where(or_(*changed))
+        stmt = stmt.order_by(Organization.name)
+
+        cls = row_class("OrganizationRow", names)
+        return [cls(*row) for row in db.execute(stmt)]
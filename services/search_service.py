@@ -0,0 +1,119 @@
+from typing import List, Optional, Tuple
+from sqlalchemy.orm import Session
+from app.core.search import get_search_backend, tokenize_query
+from app.models.oragization import Organization
+from app.models.user import User
+
+
+class SearchService:
+    """Keeps the text index in sync and runs ranked searches against it"""
+
+    @staticmethod
+    def index_user(db: Session, user: User) -> None:
+        """
+        Add or refresh a user in the search index.
+
+        Runs inside the caller's transaction, so the index entry commits
+        (or rolls back) together with the user row.
+
+        Args:
+            db: Database session
+            user: Flushed user (must have an id)
+        """
+        get_search_backend(db.get_bind()).index_user(db, user)
+
+    @staticmethod
+    def index_organization(db: Session, org: Organization) -> None:
+        """
+        Add or refresh an organization in the search index.
+
+        Args:
+            db: Database session
+            org: Flushed organization (must have an id)
+        """
+        get_search_backend(db.get_bind()).index_organization(db, org)
+
+    @staticmethod
+    def remove_organization(db: Session, org_id: int) -> None:
+        """
+        Drop an organization from the search index.
+
+        Args:
+            db: Database session
+            org_id: Organization ID
+        """
+        get_search_backend(db.get_bind()).remove_organization(db, org_id)
+
+    @staticmethod
+    def search_users(
+        db: Session,
+        query: str,
+        page: int,
+        size: int
+    ) -> Tuple[List[User], int]:
+        """
+        Ranked prefix search over username, full name and email.
+
+        Args:
+            db: Database session
+            query: Raw search text
+            page: 1-based page number
+            size: Page size
+
+        Returns:
+            Tuple of (users for this page in rank order, total matches)
+        """
+        terms = tokenize_query(query)
+        if not terms:
+            return [], 0
+
+        backend = get_search_backend(db.get_bind())
+        ids, total = backend.search_users(db, terms, size, (page - 1) * size)
+        if not ids:
+            return [], total
+
+        # Through the request's user loader: one query for the page, and
+        # users already loaded in this request (e.g. the caller) are reused
+        from app.services.user_service import UserService
+        pending = [UserService.load_user(db, user_id) for user_id in ids]
+        users = [p.result() for p in pending]
+        return [user for user in users if user is not None], total
+
+    @staticmethod
+    def search_organizations(
+        db: Session,
+        query: str,
+        page: int,
+        size: int,
+        member_id: Optional[int] = None
+    ) -> Tuple[List[Organization], int]:
+        """
+        Ranked prefix search over organization name, slug and description.
+
+        Args:
+            db: Database session
+            query: Raw search text
+            page: 1-based page number
+            size: Page size
+            member_id: If given, only organizations this user belongs to
+
+        Returns:
+            Tuple of (organizations for this page in rank order, total matches)
+        """
+        terms = tokenize_query(query)
+        if not terms:
+            return [], 0
+
+        backend = get_search_backend(db.get_bind())
+        ids, total = backend.search_organizations(
+            db, terms, size, (page - 1) * size, member_id=member_id
+        )
+        if not ids:
+            return [], total
+
+        orgs = db.query(Organization).filter(
+            Organization.id.in_(ids),
+            Organization.is_active == True
+        ).all()
+        by_id = {org.id: org for org in orgs}
+        return [by_id[i] for i in ids if i in by_id], total
@@ -0,0 +1,163 @@
+import base64
+import binascii
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional, Tuple
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from app.config import settings
+from app.models.membershiptombstone import MembershipTombstone
+from app.models.oragization import Organization
+from app.models.organizationmember import OrganizationMember
+from app.services.read_repository import ReadRepository, Row
+
+
+class CursorExpired(ValueError):
+    """The cursor predates the tombstone retention window."""
+
+
+def encode_cursor(at: datetime) -> str:
+    """Opaque cursor for a point in time (microseconds since the epoch)."""
+    micros = int(at.timestamp() * 1_000_000)
+    return base64.urlsafe_b64encode(str(micros).encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> datetime:
+    """
+    Inverse of encode_cursor.
+
+    Raises:
+        ValueError: If the cursor is malformed
+        CursorExpired: If removals since the cursor may have been pruned
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        micros = int(base64.urlsafe_b64decode(padded.encode()).decode())
+        at = datetime.fromtimestamp(micros / 1_000_000, tz=timezone.utc)
+    except (binascii.Error, UnicodeDecodeError, ValueError, OverflowError, OSError):
+        raise ValueError("Invalid sync cursor")
+    if at < datetime.now(timezone.utc) - timedelta(days=settings.SYNC_TOMBSTONE_RETENTION_DAYS):
+        raise CursorExpired("Sync cursor expired, fetch the full list again")
+    return at
+
+
+def new_cursor() -> str:
+    """Cursor for "now", taken before reading so nothing falls in between."""
+    return encode_cursor(datetime.now(timezone.utc))
+
+
+def _window_start(since: datetime) -> datetime:
+    # Re-send rows stamped shortly before the cursor: timestamps come from
+    # the database clock and a slow transaction may commit after we read
+    return since - timedelta(seconds=settings.SYNC_CURSOR_OVERLAP_SECONDS)
+
+
+class SyncService:
+    """
+    Incremental "changes since" reads for clients keeping a local copy.
+
+    Changes are found through indexed timestamps - updated_at/created_at
+    on organizations, joined_at/updated_at on memberships - and removed
+    memberships through tombstones. Upserts are idempotent, so a client
+    applies upserted then removed and stores the returned cursor.
+    """
+
+    @staticmethod
+    def organization_changes(
+        db: Session,
+        user_id: int,
+        since: datetime,
+        fields: Optional[List[str]] = None
+    ) -> Tuple[List[Row], List[int]]:
+        """
+        Organizations of a user that changed since a cursor.
+
+        Args:
+            db: Database session
+            user_id: User ID
+            since: Decoded cursor
+            fields: Sparse fieldset (see ReadRepository.get_user_organizations)
+
+        Returns:
+            Tuple: (changed organizations, IDs of organizations to drop -
+            soft-deleted ones and ones the user was removed from)
+        """
+        start = _window_start(since)
+        upserted = ReadRepository.get_user_organizations(db, user_id, fields, since=start)
+
+        deleted = select(Organization.id).join(
+            OrganizationMember,
+            Organization.id == OrganizationMember.organization_id
+        ).where(
+            OrganizationMember.user_id == user_id,
+            Organization.is_active == False,
+            Organization.updated_at > start
+        )
+        left = select(MembershipTombstone.organization_id).where(
+            MembershipTombstone.user_id == user_id,
+            MembershipTombstone.removed_at > start
+        )
+        removed = set(db.scalars(deleted)) | set(db.scalars(left))
+        if removed:
+            # Current state wins over a removal followed by a re-join
+            removed -= set(db.scalars(
+                select(OrganizationMember.organization_id).join(
+                    Organization,
+                    Organization.id == OrganizationMember.organization_id
+                ).where(
+                    OrganizationMember.user_id == user_id,
+                    OrganizationMember.organization_id.in_(removed),
+                    Organization.is_active == True
+                )
+            ))
+        return upserted, sorted(removed)
+
+    @staticmethod
+    def member_changes(
+        db: Session,
+        org_id: int,
+        since: datetime,
+        fields: Optional[List[str]] = None
+    ) -> Tuple[List[Row], List[int]]:
+        """
+        Memberships of an organization that changed since a cursor.
+
+        An organization whose members have not changed is answered from
+        its members_changed_at watermark alone (one primary key probe).
+
+        Args:
+            db: Database session
+            org_id: Organization ID
+            since: Decoded cursor
+            fields: Sparse fieldset (see ReadRepository.get_organization_members)
+
+        Returns:
+            Tuple: (added or updated members, IDs of removed users)
+        """
+        start = _window_start(since)
+        changed_at = db.scalar(
+            select(Organization.members_changed_at).where(Organization.id == org_id)
+        )
+        if changed_at is not None and _as_utc(changed_at) <= start:
+            return [], []
+
+        upserted = ReadRepository.get_organization_members(db, org_id, fields, since=start)
+        removed = set(db.scalars(
+            select(MembershipTombstone.user_id).where(
+                MembershipTombstone.organization_id == org_id,
+                MembershipTombstone.removed_at > start
+            )
+        ))
+        if removed:
+            # A removed user who re-joined is reported as a member
+            removed -= set(db.scalars(
+                select(OrganizationMember.user_id).where(
+                    OrganizationMember.organization_id == org_id,
+                    OrganizationMember.user_id.in_(removed)
+                )
+            ))
+        return upserted, sorted(removed)
+
+
+def _as_utc(value: datetime) -> datetime:
+    # SQLite hands back naive UTC timestamps
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
@@ -0,0 +1,152 @@
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional, Tuple
+from sqlalchemy.orm import Session
+from app.config import settings
+from app.core.invalidation import invalidation_bus
+from app.core.revocation import revocation_list
+from app.core.security import create_access_token, create_refresh_token, decode_refresh_token
+from app.models.refreshtoken import RefreshToken
+from app.models.revokedtoken import RevokedToken
+
+
+class TokenService:
+    """Issues, rotates and revokes access/refresh token pairs"""
+
+    @staticmethod
+    def _new_token_pair(db: Session, user_id: int) -> Tuple[dict, str]:
+        # Adds the refresh token row; the caller commits
+        jti = uuid.uuid4().hex
+        expires_at = datetime.now(timezone.utc) + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
+        db.add(RefreshToken(jti=jti, user_id=user_id, expires_at=expires_at))
+
+        tokens = {
+            "access_token": create_access_token({"sub": str(user_id)}),
+            "refresh_token": create_refresh_token(user_id, jti, expires_at),
+            "token_type": "bearer"
+        }
+        return tokens, jti
+
+    @staticmethod
+    def issue_tokens(db: Session, user_id: int) -> dict:
+        """
+        Create a new access token and a persisted refresh token.
+
+        Args:
+            db: Database session
+            user_id: User the tokens are for
+
+        Returns:
+            Dict with access_token, refresh_token and token_type
+        """
+        tokens, _ = TokenService._new_token_pair(db, user_id)
+        db.commit()
+        return tokens
+
+    @staticmethod
+    def rotate_refresh_token(db: Session, refresh_token: str) -> dict:
+        """
+        Exchange a refresh token for a new token pair.
+
+        The presented token is revoked and linked to its replacement in a
+        single conditional UPDATE, so of two concurrent refreshes only one
+        can win. Presenting an already-rotated token (or losing that race)
+        means it leaked, so every token rotated from it is revoked.
+
+        Args:
+            db: Database session
+            refresh_token: Encoded refresh token from the client
+
+        Returns:
+            Dict with access_token, refresh_token and token_type
+
+        Raises:
+            ValueError: If the token is invalid, expired, revoked or reused
+        """
+        payload = decode_refresh_token(refresh_token)
+        if payload is None:
+            raise ValueError("Invalid refresh token")
+
+        stored = db.query(RefreshToken).filter(
+            RefreshToken.jti == payload.get("jti")
+        ).first()
+        if not stored or str(stored.user_id) != payload.get("sub"):
+            raise ValueError("Invalid refresh token")
+
+        jti = stored.jti
+        now = datetime.now(timezone.utc)
+        tokens, new_jti = TokenService._new_token_pair(db, stored.user_id)
+        rotated = db.query(RefreshToken).filter(
+            RefreshToken.jti == jti,
+            RefreshToken.revoked_at.is_(None)
+        ).update(
+            {RefreshToken.revoked_at: now, RefreshToken.replaced_by: new_jti},
+            synchronize_session=False
+        )
+        if rotated != 1:
+            # Reuse of a rotated token - cut off its family
+            db.rollback()
+            descendants = TokenService._descendants(db, jti)
+            if descendants:
+                db.query(RefreshToken).filter(
+                    RefreshToken.jti.in_(descendants),
+                    RefreshToken.revoked_at.is_(None)
+                ).update({RefreshToken.revoked_at: now}, synchronize_session=False)
+                db.commit()
+            raise ValueError("Refresh token has been revoked")
+
+        db.commit()
+        return tokens
+
+    @staticmethod
+    def _descendants(db: Session, jti: str) -> List[str]:
+        # Follow replaced_by links: every token rotated out of this one
+        found: List[str] = []
+        current = db.query(RefreshToken.replaced_by).filter(RefreshToken.jti == jti).scalar()
+        while current and current not in found:
+            found.append(current)
+            current = db.query(RefreshToken.replaced_by).filter(RefreshToken.jti == current).scalar()
+        return found
+
+    @staticmethod
+    def revoke_access_token(db: Session, payload: dict) -> None:
+        """
+        Revoke an access token before it expires.
+
+        Args:
+            db: Database session
+            payload: Decoded access token payload (needs jti and exp)
+        """
+        jti = payload.get("jti")
+        if not jti:
+            # Tokens issued before jti existed simply run out
+            return
+        if not revocation_list.is_revoked(jti):
+            db.add(RevokedToken(
+                jti=jti,
+                expires_at=datetime.fromtimestamp(payload["exp"], timezone.utc)
+            ))
+            db.commit()
+        # Applies locally right away and reaches the other workers over the bus
+        invalidation_bus.publish("token.revoked", jti, {"exp": payload["exp"]})
+
+    @staticmethod
+    def logout(db: Session, access_payload: dict, refresh_token: Optional[str] = None) -> None:
+        """
+        Revoke the current access token and, if given, its refresh token.
+
+        Args:
+            db: Database session
+            access_payload: Decoded access token payload
+            refresh_token: Encoded refresh token to revoke as well
+        """
+        if refresh_token:
+            payload = decode_refresh_token(refresh_token)
+            if payload is not None:
+                db.query(RefreshToken).filter(
+                    RefreshToken.jti == payload.get("jti"),
+                    RefreshToken.user_id == int(access_payload["sub"]),
+                    RefreshToken.revoked_at.is_(None)
+                ).update({RefreshToken.revoked_at: datetime.now(timezone.utc)}, synchronize_session=False)
+        TokenService.revoke_access_token(db, access_payload)
+        db.commit()
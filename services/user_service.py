@@ -1,9 +1,45 @@
 from app.schemas.user import UserCreate,UserLogin,UserResponse,UserUpdate
+from sqlalchemy import func, or_, select, update
 from sqlalchemy.orm import Session
+from app.models.oragization import Organization
+from app.models.organizationmember import OrganizationMember
 from app.models.user import User
 from passlib.context import CryptContext
-from typing import Optional
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+from app.config import settings
+from app.core.cache import MISSING, LocalCache
+from app.core.dataloader import DataLoader, Pending, get_loader
+from app.core.invalidation import invalidation_bus
+from app.core.jobs import job_queue
+from app.services.jobs import rehash_password
+from app.services.search_service import SearchService
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# user_id -> (created_at, updated_at); dropped on every worker when a user changes
+_user_versions = LocalCache("user_versions", settings.CACHE_MAX_ENTRIES, settings.CACHE_TTL_SECONDS)
+invalidation_bus.subscribe("user", _user_versions.on_invalidate)
+
+def _touch_user_organizations(db: Session, user_id: int) -> None:
+    # Member listings show username/email (also as invited_by), so a change
+    # to them must move the delta-sync watermark of every org showing them
+    shown_in = select(OrganizationMember.organization_id).where(or_(
+        OrganizationMember.user_id == user_id,
+        OrganizationMember.invited_by_id == user_id
+    ))
+    db.execute(
+        update(Organization).where(
+            Organization.id.in_(shown_in)
+        ).values(
+            members_changed_at=func.now(),
+            updated_at=Organization.updated_at
+        ).execution_options(synchronize_session=False)
+    )
+
+def _users_by_id(db: Session):
+    def batch(user_ids: List[int]) -> Dict[int, User]:
+        return {user.id: user for user in db.query(User).filter(User.id.in_(user_ids))}
+    return batch
+
 class UserService():
     @staticmethod
     def register_user(db: Session , userdata: UserCreate) -> User:
@@ -19,8 +55,13 @@ class UserService():
         user_create_dict["hashed_password"]=hashed_password
         user = User(**user_create_dict)
         db.add(user)
+        db.flush()
+        SearchService.index_user(db, user)
         db.commit()
         db.refresh(user)
+        UserService.user_loader(db).prime(user.id, user)
+        # Drop any cached "no such user" entry
+        invalidation_bus.publish("user", user.id)
         return user
     
     @staticmethod
@@ -30,13 +71,44 @@ class UserService():
             raise ValueError("Email or Password Incorrect")
         if not pwd_context.verify(userdata.password,user.hashed_password):
            raise ValueError("Email or Password Incorrect")
+        # Upgrading an outdated hash costs a full bcrypt round - do it off the request
+        if pwd_context.needs_update(user.hashed_password):
+            job_queue.enqueue(rehash_password, user.id, userdata.password)
         return user
         
+    @staticmethod
+    def user_loader(db: Session) -> DataLoader:
+        # Request-scoped: lives in the session opened by get_db
+        return get_loader(db, "users", _users_by_id)
+
+    @staticmethod
+    def load_user(db: Session , user_id: int ) -> Pending:
+        # Deferred lookup - every load_user() before the first .result() shares one query
+        return UserService.user_loader(db).load(user_id)
+
     @staticmethod
     def get_user_by_id(db: Session , user_id: int ) -> Optional[User]:
-        return db.query(User).filter(User.id == user_id).first()
+        # Resolves immediately; callers with several ids should load_user() them all first
+        return UserService.load_user(db, user_id).result()
+
+    @staticmethod
+    def get_users_by_ids(db: Session , user_ids: List[int] ) -> List[User]:
+        # One IN query for all ids; unknown ids are skipped, order and duplicates follow the input
+        users = UserService.user_loader(db).load_many(user_ids)
+        return [user for user in users if user is not None]
 
     
+    @staticmethod
+    def get_user_version(db: Session , user_id: int ) -> Optional[Tuple[datetime, Optional[datetime]]]:
+        # Only the timestamps - enough to answer a conditional GET without loading the row
+        version = _user_versions.get(user_id)
+        if version is MISSING:
+            generation = _user_versions.generation()
+            row = db.query(User.created_at, User.updated_at).filter(User.id == user_id).first()
+            version = tuple(row) if row else None
+            _user_versions.set(user_id, version, generation)
+        return version
+
     @staticmethod
     def get_user_by_email(db: Session , email: str ) -> Optional[User]:
         return db.query(User).filter(User.email == email).first()
@@ -68,9 +140,16 @@ class UserService():
         for key, value in update_data.items():
             setattr(user, key, value)
 
+        if update_data:
+            SearchService.index_user(db, user)
+        if "username" in update_data or "email" in update_data:
+            _touch_user_organizations(db, user_id)
+
         db.commit()        # 🔥 THIS is what you were missing
         db.refresh(user)  # optional but good practice
 
+        invalidation_bus.publish("user", user_id)
+
         return user
 
     